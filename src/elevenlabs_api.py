@@ -5,6 +5,7 @@ import logging
 import requests
 import json
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Import using try/except for flexibility
@@ -20,6 +21,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Concurrent document uploads in update_knowledge_base_batch
+MAX_CONCURRENT_UPLOADS = 4
+
 
 class ElevenLabsClient:
     """
@@ -484,4 +488,97 @@ class ElevenLabsClient:
                         logger.error(f"Failed to assign document {doc_id} to agent {agent_id}")
                 
                 return success
-            return False 
\ No newline at end of file
+            return False 
+    
+    def _replace_document(self, page_name, content, existing_docs, force_update=False):
+        """
+        Delete any existing document for a page and upload the new content.
+        
+        Args:
+            page_name (str): Name of the page
+            content (str): Content to upload
+            existing_docs (list): Current knowledge base documents
+            force_update (bool): Whether to upload even if deleting the old version fails
+            
+        Returns:
+            tuple: Whether the upload succeeded, the ID of the uploaded document
+            (None if the response did not name one) and the ID of the old
+            version to detach from agents (None if there is nothing to detach)
+        """
+        old_id = None
+        deleted = False
+        for doc in existing_docs:
+            if isinstance(doc, dict) and doc.get("name") in (f"{page_name}.txt", page_name):
+                old_id = doc.get("id")
+                logger.info(f"Found existing document '{doc.get('name')}' with ID {old_id}, deleting first")
+                deleted = self.delete_knowledge_base_doc(old_id)
+                if not deleted and not force_update:
+                    logger.info("Skipping update due to deletion failure. Use force_update=True to override.")
+                    return False, None, None
+                break
+        
+        result = self.add_to_knowledge_base(page_name, content, document_type="file")
+        if result is None:
+            logger.error(f"Failed to update knowledge base with {page_name}")
+            # A deleted document must not stay assigned even though nothing replaced it
+            return False, None, old_id if deleted else None
+        
+        doc_id = None
+        if isinstance(result, dict):
+            doc_id = result.get("document_id") or result.get("id")
+        if not doc_id:
+            logger.error(f"Document was added but couldn't determine document ID. Response: {json.dumps(result)}")
+        return True, doc_id, old_id
+    
+    def update_knowledge_base_batch(self, items, agent_id=None, force_update=False):
+        """
+        Update several knowledge base documents and assign them to an agent at once.
+        
+        The API has no batch upload, so documents are replaced concurrently and
+        the agent is then updated with a single request instead of once per
+        document.
+        
+        Args:
+            items (dict): Mapping of page name to content
+            agent_id (str, optional): Agent ID to assign the documents to
+            force_update (bool): Whether to upload even if deleting an old version fails
+            
+        Returns:
+            dict: Mapping of page name to True if its document was updated
+        """
+        logger.info(f"Updating knowledge base for {len(items)} documents: {', '.join(items)}")
+        
+        # List the knowledge base once for all documents
+        existing_docs = self.get_knowledge_base_docs()
+        
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_UPLOADS) as executor:
+            futures = {
+                name: executor.submit(self._replace_document, name, content, existing_docs, force_update)
+                for name, content in items.items()
+            }
+            results = {name: future.result() for name, future in futures.items()}
+        
+        new_ids = [doc_id for _, doc_id, _ in results.values() if doc_id]
+        dropped_ids = {old_id for _, _, old_id in results.values() if old_id}
+        if agent_id and (new_ids or dropped_ids):
+            # Keep the agent's other documents, dropping old versions that were
+            # deleted or superseded
+            docs_by_id = {d.get("id"): d for d in existing_docs if isinstance(d, dict)}
+            
+            kb_ids = []
+            agent_config = self.get_agent(agent_id)
+            try:
+                knowledge_base_items = agent_config["conversation_config"]["agent"]["prompt"].get("knowledge_base", [])
+                for item in knowledge_base_items:
+                    kb_doc = docs_by_id.get(item.get("id")) if isinstance(item, dict) else None
+                    if kb_doc and item["id"] not in dropped_ids:
+                        kb_ids.append(item["id"])
+            except (KeyError, TypeError) as e:
+                logger.warning(f"Error extracting existing knowledge base IDs: {e}")
+            
+            if self.update_agent_knowledge_base(agent_id, kb_ids + new_ids):
+                logger.info(f"Successfully assigned {len(new_ids)} documents to agent {agent_id}")
+            else:
+                logger.error(f"Failed to assign documents to agent {agent_id}")
+        
+        return {name: success for name, (success, _, _) in results.items()}
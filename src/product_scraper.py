@@ -200,23 +200,30 @@ class ProductDetailScraper:
     Scraper for Taurbull product details.
     """
     
-    def __init__(self):
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+    }
+    
+    def __init__(self, session: Optional[requests.Session] = None):
         """
         Initialize the product detail scraper.
+        
+        Args:
+            session: Optional HTTP session to share with other scrapers.
+                A new session is created if not provided.
         """
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        })
+        self.session = session or requests.Session()
     
-    def scrape_product_details(self, product_url: str) -> Dict[str, Any]:
+    def scrape_product_details(self, product_url: str, html: Optional[str] = None) -> Dict[str, Any]:
         """
         Scrape detailed information for a specific product.
         
         Args:
             product_url: URL of the product page
+            html: HTML of the product page if already fetched; the page is
+                downloaded when omitted
             
         Returns:
             Dictionary with detailed product information
@@ -224,12 +231,14 @@ class ProductDetailScraper:
         logger.info(f"Scraping product details: {product_url}")
         
         try:
-            # Fetch the page
-            response = self.session.get(product_url)
-            response.raise_for_status()
+            # Fetch the page unless the caller already has it
+            if html is None:
+                response = self.session.get(product_url, headers=self.HEADERS)
+                response.raise_for_status()
+                html = response.text
             
             # Parse HTML
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(html, "html.parser")
             
             # Extract product details
             product_details = self._extract_product_details(soup, product_url)
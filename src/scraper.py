@@ -1,20 +1,40 @@
 """
 Web scraper module for Taurbull website.
 """
+import asyncio
 import json
 import logging
 import requests
 import re
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+import lxml.etree
+import lxml.html
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from html import unescape
 from urllib.parse import urljoin
 from typing import List, Dict, Any
 
+# orjson is considerably faster for JSON-LD payloads but not required;
+# its JSONDecodeError subclasses the stdlib one
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 # Import using try/except for flexibility
 try:
-    from src.config import DEBUG
+    from src.config import CACHE_DIR, DEBUG
     from src.product_scraper import ProductDetailScraper
 except ImportError:
-    from config import DEBUG
+    from config import CACHE_DIR, DEBUG
     from product_scraper import ProductDetailScraper
 
 # Configure logging
@@ -24,33 +44,281 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Concurrency limits for asynchronous product scraping; the HTTP pool holds
+# CONNECTION_LIMIT keep-alive connections to the shop
+MAX_CONCURRENT_PRODUCTS = 15
+CONNECTION_LIMIT = 20
+
+# Concurrent page fetches in scrape_faqs
+MAX_FAQ_WORKERS = 16
+
+# Number of catalog pages fetched ahead while paginating
+CATALOG_PREFETCH_PAGES = 4
+
+# Catalog pages are streamed in chunks until the pagination link is seen
+CATALOG_CHUNK_SIZE = 16384
+_PAGINATION_MARKER = 'pagination__item--next'
+_PAGINATION_LINK_RE = re.compile(r'<a\b[^>]*' + _PAGINATION_MARKER + r'[^>]*>', re.IGNORECASE)
+
+# JSON-LD script bodies and HTML tags, matched without building a DOM
+_JSONLD_RE = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE
+)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Parser lookups for JSON-LD scripts, used where the regex does not apply
+_JSONLD_SELECTOR = 'script[type*="ld+json"]'
+_JSONLD_XPATH = '//script[contains(@type, "ld+json")]'
+
+# Patterns used while scraping catalog and product pages
+_PRODUCT_URL_JSON_RE = re.compile(r'"url":"(/products/[^"]+)"')
+_COLLECTION_RE = re.compile(r'collection_viewed.*?productVariants', re.DOTALL)
+_WS_RE = re.compile(r'\s+')
+
+# Inline scripts shorter than this cannot hold the collection product payload
+_MIN_PRODUCT_SCRIPT_LENGTH = 200
+
+# Catalog pages only need link extraction, so skip the id index, comments and PIs
+_CATALOG_PARSER = lxml.html.HTMLParser(collect_ids=False, remove_comments=True, remove_pis=True)
+
+# Restrict parsing to the parts of the legal page the extractor actually reads
+_LEGAL_STRAINER = SoupStrainer(['main', 'article', 'div'])
+
+# Recently extracted FAQ pages kept in memory; unchanged pages skip parsing
+FAQ_CACHE_SIZE = 32
+
+# On-disk HTTP cache shared across scraper runs
+HTTP_CACHE_PATH = CACHE_DIR / "http_cache"
+HTTP_CACHE_EXPIRE_SECONDS = 3600
+
+# Timeout in seconds for page requests
+REQUEST_TIMEOUT = 30
+
+HEADERS = {
+    'User-Agent': 'TaurbullContentScraper/1.0'
+}
+
+
+def _parse_jsonld_scripts(html):
+    """
+    Find JSON-LD script bodies with an HTML parser.
+    
+    Uses selectolax when it is installed and falls back to BeautifulSoup if it
+    is missing or fails on the document.
+    
+    Args:
+        html (str): HTML content
+        
+    Returns:
+        List[str]: Text of each JSON-LD script
+    """
+    if LexborHTMLParser is not None:
+        try:
+            return [node.text() for node in LexborHTMLParser(html).css(_JSONLD_SELECTOR)]
+        except Exception as e:
+            logger.warning("selectolax could not parse JSON-LD scripts, using BeautifulSoup: %s", e)
+    
+    soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer('script'))
+    return [script.string or '' for script in soup.select(_JSONLD_SELECTOR)]
+
+
+def _jsonld_blocks(html):
+    """
+    Return the JSON-LD script bodies of a page.
+    
+    The regex covers the usual markup; the parser is only used when the page
+    mentions JSON-LD but the regex found nothing, e.g. for an unquoted type.
+    
+    Args:
+        html (str): HTML content
+        
+    Returns:
+        List[str]: Text of each JSON-LD script
+    """
+    blocks = [match.group(1) for match in _JSONLD_RE.finditer(html)]
+    if blocks or 'ld+json' not in html:
+        return blocks
+    return _parse_jsonld_scripts(html)
+
+
+def _load_jsonld(html, marker=None):
+    """
+    Decode the JSON-LD blocks of a page.
+    
+    Blocks are located with the regex first. If one of them is not valid
+    JSON, e.g. because the regex also matched a commented-out script, the
+    scripts are located again with an HTML parser and decoded one by one.
+    
+    Args:
+        html (str): HTML content
+        marker (str, optional): Only decode blocks containing this text, so
+            unrelated structured data (products, breadcrumbs) is skipped
+        
+    Returns:
+        List[Any]: Decoded JSON-LD objects
+    """
+    try:
+        return [_json_loads(block) for block in _jsonld_blocks(html) if not marker or marker in block]
+    except json.JSONDecodeError as e:
+        logger.warning("Error parsing JSON-LD, re-reading scripts with an HTML parser: %s", e)
+    
+    data = []
+    for block in _parse_jsonld_scripts(html):
+        if marker and marker not in block:
+            continue
+        try:
+            data.append(_json_loads(block))
+        except json.JSONDecodeError as e:
+            logger.warning("Error parsing JSON-LD: %s", e)
+    return data
+
+
+def _load_tree_jsonld(tree, marker=None):
+    """
+    Decode the JSON-LD blocks of an already parsed lxml document.
+    
+    Args:
+        tree (lxml.html.HtmlElement): Parsed HTML document
+        marker (str, optional): Only decode blocks containing this text
+        
+    Returns:
+        List[Any]: Decoded JSON-LD objects
+    """
+    data = []
+    for script in tree.xpath(_JSONLD_XPATH):
+        block = script.text or ''
+        if marker and marker not in block:
+            continue
+        try:
+            data.append(_json_loads(block))
+        except json.JSONDecodeError as e:
+            logger.warning("Error parsing JSON-LD: %s", e)
+    return data
+
+
+@lru_cache(maxsize=FAQ_CACHE_SIZE)
+def _extract_faq(html):
+    """
+    Build the Q&A text for a FAQ page, memoized on the page HTML.
+    
+    Args:
+        html (str): HTML content of the FAQ page
+        
+    Returns:
+        str: Formatted FAQ content as Q&A text
+    """
+    # Read JSON-LD script bodies directly instead of building a full DOM. Both
+    # FAQPage and Question blocks name the Question type, other blocks are
+    # not decoded at all.
+    return _format_faq(_load_jsonld(html, marker='Question'))
+
+
+def _format_faq(jsonld):
+    """
+    Build the Q&A text from decoded JSON-LD objects.
+    
+    Args:
+        jsonld (List[Any]): Decoded JSON-LD objects of a FAQ page
+        
+    Returns:
+        str: Formatted FAQ content as Q&A text
+    """
+    logger.debug("Extracting FAQ content from HTML")
+    
+    parts = []
+    faq_items_processed = 0
+    
+    for data in jsonld:
+        try:
+            # Check for FAQPage type or FAQ items in mainEntity
+            if '@type' in data:
+                if data['@type'] == 'FAQPage' and 'mainEntity' in data:
+                    # Process FAQPage format
+                    for item in data['mainEntity']:
+                        if item.get('@type') == 'Question':
+                            question = item.get('name', '')
+                            answer_raw = item.get('acceptedAnswer', {}).get('text', '')
+                            
+                            # Clean HTML from answer
+                            clean_answer = unescape(_TAG_RE.sub('', answer_raw)).strip()
+                            
+                            parts.append(f"Q: {question}\nA: {clean_answer}\n\n")
+                            faq_items_processed += 1
+                
+                # Check for individual Question format
+                elif data['@type'] == 'Question':
+                    question = data.get('name', '')
+                    answer_raw = data.get('acceptedAnswer', {}).get('text', '')
+                    
+                    # Clean HTML from answer
+                    clean_answer = unescape(_TAG_RE.sub('', answer_raw)).strip()
+                    
+                    parts.append(f"Q: {question}\nA: {clean_answer}\n\n")
+                    faq_items_processed += 1
+        
+        except (AttributeError, TypeError) as e:
+            logger.warning("Error parsing JSON-LD: %s", e)
+            continue
+    
+    logger.info("Extracted %s FAQ items", faq_items_processed)
+    return "".join(parts).strip()
+
 
 class TaurbullScraper:
     """Scraper for Taurbull website content."""
 
-    @staticmethod
-    def get_page_content(url):
+    def __init__(self):
+        """
+        Initialize the scraper with a cached HTTP session.
+        
+        Responses are stored in an SQLite cache that honors Cache-Control
+        and ETag revalidation, so unchanged pages are not re-downloaded on
+        repeat runs. Streamed requests use a plain session instead, since the
+        cache reads the whole body before returning a response.
+        """
+        self._session = requests_cache.CachedSession(
+            str(HTTP_CACHE_PATH),
+            backend='sqlite',
+            expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+            cache_control=True
+        )
+        self._stream_session = requests.Session()
+        # Keep enough pooled keep-alive connections for the catalog prefetch
+        # threads and concurrent product page fetches to the same host; both
+        # sessions share the pool
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=CONNECTION_LIMIT)
+        for session in (self._session, self._stream_session):
+            session.headers.update(HEADERS)
+            session.mount('https://', adapter)
+        self._product_scraper = ProductDetailScraper(session=self._session)
+
+    def get_page_content(self, url, stream=False):
         """
         Fetch HTML content from a URL.
         
         Args:
             url (str): The URL to fetch
+            stream (bool): Return the response without reading the body. Such
+                requests bypass the HTTP cache so the body can be cut short
             
         Returns:
-            str: HTML content of the page
+            str or requests.Response: HTML content of the page, or the
+            streaming response if stream is True
             
         Raises:
             requests.RequestException: If the request fails
         """
         try:
-            logger.debug(f"Fetching content from {url}")
-            response = requests.get(url, headers={
-                'User-Agent': 'TaurbullContentScraper/1.0'
-            })
+            logger.debug("Fetching content from %s", url)
+            session = self._stream_session if stream else self._session
+            response = session.get(url, stream=stream, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
+            if stream:
+                return response
             return response.text
         except requests.RequestException as e:
-            logger.error(f"Error fetching {url}: {e}")
+            logger.error("Error fetching %s: %s", url, e)
             raise
 
     def extract_faq_content(self, html):
@@ -58,58 +326,16 @@ class TaurbullScraper:
         Extract FAQ content from HTML using JSON-LD structured data.
         
         Args:
-            html (str): HTML content of the FAQ page
+            html (Union[str, lxml.html.HtmlElement]): HTML content of the FAQ
+                page, or a document the caller has already parsed with lxml
             
         Returns:
             str: Formatted FAQ content as Q&A text
         """
-        logger.debug("Extracting FAQ content from HTML")
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Find JSON-LD script tags
-        script_tags = soup.find_all('script', type='application/ld+json')
-        
-        faq_content = ""
-        faq_items_processed = 0
-        
-        for script in script_tags:
-            try:
-                data = json.loads(script.string)
-                
-                # Check for FAQPage type or FAQ items in mainEntity
-                if '@type' in data:
-                    if data['@type'] == 'FAQPage' and 'mainEntity' in data:
-                        # Process FAQPage format
-                        for item in data['mainEntity']:
-                            if item.get('@type') == 'Question':
-                                question = item.get('name', '')
-                                answer_raw = item.get('acceptedAnswer', {}).get('text', '')
-                                
-                                # Clean HTML from answer
-                                answer_soup = BeautifulSoup(answer_raw, 'html.parser')
-                                clean_answer = answer_soup.get_text().strip()
-                                
-                                faq_content += f"Q: {question}\nA: {clean_answer}\n\n"
-                                faq_items_processed += 1
-                    
-                    # Check for individual Question format
-                    elif data['@type'] == 'Question':
-                        question = data.get('name', '')
-                        answer_raw = data.get('acceptedAnswer', {}).get('text', '')
-                        
-                        # Clean HTML from answer
-                        answer_soup = BeautifulSoup(answer_raw, 'html.parser')
-                        clean_answer = answer_soup.get_text().strip()
-                        
-                        faq_content += f"Q: {question}\nA: {clean_answer}\n\n"
-                        faq_items_processed += 1
-            
-            except (json.JSONDecodeError, AttributeError) as e:
-                logger.warning(f"Error parsing JSON-LD: {e}")
-                continue
-        
-        logger.info(f"Extracted {faq_items_processed} FAQ items")
-        return faq_content.strip()
+        if isinstance(html, str):
+            return _extract_faq(html)
+        # Parsed documents are read in place; the memo is keyed on page text
+        return _format_faq(_load_tree_jsonld(html, marker='Question'))
 
     def extract_legal_page_content(self, html):
         """
@@ -122,7 +348,7 @@ class TaurbullScraper:
             str: Formatted legal content as text
         """
         logger.debug("Extracting legal page content from HTML")
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml', parse_only=_LEGAL_STRAINER)
         
         # Find the main content container - usually this is within a specific div or section
         # For Taurbull's legal pages, the main content is typically in the main section
@@ -134,44 +360,41 @@ class TaurbullScraper:
             
         if not content_container:
             logger.warning("Could not find main content container. Using body content instead.")
-            content_container = soup.body
+            content_container = BeautifulSoup(html, 'lxml').body
             
         if not content_container:
             logger.error("Could not extract content from page")
             return ""
             
-        # Extract all headings and paragraphs from the content
-        headings = content_container.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        paragraphs = content_container.find_all('p')
-        
-        # Format the content
-        formatted_content = ""
-        
-        # Add major headings first
-        for heading in headings:
-            heading_text = heading.get_text().strip()
+        # Walk headings and paragraphs in a single pass, preserving source order
+        parts = []
+        for element in content_container.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p']):
+            if element.name == 'p':
+                para_text = element.get_text().strip().replace('\n', ' ')
+                if para_text:
+                    parts.append(f"{para_text}\n\n")
+                continue
+            
+            heading_text = element.get_text().strip()
             if heading_text:
-                tag = heading.name  # gets h1, h2, etc.
                 # Format based on heading level
-                if tag == 'h1':
-                    formatted_content += f"# {heading_text}\n\n"
-                elif tag == 'h2':
-                    formatted_content += f"## {heading_text}\n\n"
+                if element.name == 'h1':
+                    parts.append(f"# {heading_text}\n\n")
+                elif element.name == 'h2':
+                    parts.append(f"## {heading_text}\n\n")
                 else:
-                    formatted_content += f"### {heading_text}\n\n"
+                    parts.append(f"### {heading_text}\n\n")
         
-        # Add paragraphs
-        for para in paragraphs:
-            para_text = para.get_text().strip().replace('\n', ' ')
-            if para_text:
-                formatted_content += f"{para_text}\n\n"
+        formatted_content = "".join(parts)
         
         # If we didn't get any structured content, try to extract all text
         if not formatted_content.strip():
             logger.warning("No structured content found. Extracting all text.")
             formatted_content = content_container.get_text().strip()
             
-        logger.info(f"Extracted {len(formatted_content.split())} words from legal page")
+        # Counting words splits the whole page, so only do it when it is logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Extracted %s words from legal page", len(formatted_content.split()))
         return formatted_content.strip()
 
     def scrape_faq(self, url):
@@ -187,6 +410,26 @@ class TaurbullScraper:
         html = self.get_page_content(url)
         content = self.extract_faq_content(html)
         return content
+
+    def scrape_faqs(self, urls):
+        """
+        Scrape FAQ content from several URLs concurrently.
+        
+        Args:
+            urls (List[str]): URLs of the FAQ pages
+            
+        Returns:
+            Dict[str, str]: Formatted FAQ content by URL, in the order given
+            
+        Raises:
+            requests.RequestException: If any of the pages cannot be fetched
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_FAQ_WORKERS, len(urls))) as executor:
+            return dict(zip(urls, executor.map(self.scrape_faq, urls)))
         
     def scrape_legal_page(self, url):
         """
@@ -202,84 +445,183 @@ class TaurbullScraper:
         content = self.extract_legal_page_content(html)
         return content
         
+    def _fetch_catalog_page(self, url):
+        """
+        Fetch a catalog page, reading the body only as far as needed.
+        
+        Catalog parsing needs the product links and the next-page link, so
+        reading stops at the end of the pagination link or the closing body
+        tag and the connection is released early. Catalog pages are therefore
+        not stored in the HTTP cache.
+        
+        Args:
+            url (str): URL of the catalog page
+            
+        Returns:
+            str: HTML content of the page, possibly truncated after the pagination link
+        """
+        response = self.get_page_content(url, stream=True)
+        response.encoding = response.encoding or 'utf-8'
+        
+        parts = []
+        tail = ""
+        try:
+            for chunk in response.iter_content(chunk_size=CATALOG_CHUNK_SIZE, decode_unicode=True):
+                parts.append(chunk)
+                
+                # Stop at the closing body tag or once the pagination link's
+                # opening tag is complete. The class name alone is not enough,
+                # themes also mention it in inline CSS and JSON in <head>.
+                window = tail + chunk
+                if '</body>' in window or _PAGINATION_LINK_RE.search(window):
+                    break
+                
+                # Carry an unfinished tag over so tags split across chunks are found
+                tag_start = window.rfind('<')
+                tail = window[tag_start:] if tag_start != -1 and '>' not in window[tag_start:] else ""
+        finally:
+            response.close()
+        
+        return "".join(parts)
+        
+    def _parse_catalog_page(self, html):
+        """
+        Extract product links from a single catalog page.
+        
+        Args:
+            html (str): HTML content of the catalog page
+            
+        Returns:
+            tuple: (list of product URLs found on the page, whether a next page exists)
+        """
+        base_url = "https://taurbull.com"
+        
+        try:
+            doc = lxml.html.fromstring(html, parser=_CATALOG_PARSER)
+        except lxml.etree.ParserError as e:
+            logger.warning("Could not parse catalog page: %s", e)
+            return [], False
+        
+        # Find product links
+        product_links = []
+        has_next_page = False
+        
+        # Method 1: Look for a tags that contain product URLs
+        for a_tag in doc.iter('a'):
+            href = a_tag.get('href')
+            if href and '/products/' in href and '?' not in href:  # Avoid duplicate links with query params
+                product_links.append(urljoin(base_url, href))
+            
+            # Check if there's a next page
+            if not has_next_page and _PAGINATION_MARKER in (a_tag.get('class') or '').split():
+                has_next_page = True
+        
+        # Method 2: Extract from product JSON data if available
+        for script in doc.iter('script'):
+            if script.get('src') is not None:
+                continue
+            script_text = script.text
+            
+            # Skip empty and short snippets before any scanning
+            if not script_text or len(script_text) < _MIN_PRODUCT_SCRIPT_LENGTH:
+                continue
+            
+            if _COLLECTION_RE.search(script_text):
+                try:
+                    # Find the section with product URLs
+                    start_idx = script_text.find('"productVariants":[')
+                    if start_idx > 0:
+                        # Extract URLs from the JSON data
+                        for match in _PRODUCT_URL_JSON_RE.finditer(script_text, start_idx):
+                            product_links.append(urljoin(base_url, match.group(1)))
+                except Exception as e:
+                    logger.error("Error parsing product data from script: %s", e)
+        
+        return product_links, has_next_page
+        
     def get_all_product_urls(self, catalog_url):
         """
         Get all product URLs from the catalog page, handling pagination.
         
+        The page count is unknown up front, so a rolling window of
+        CATALOG_PREFETCH_PAGES pages is fetched speculatively while pages are
+        processed in order. Outstanding fetches are cancelled once the last
+        page is reached.
+        
         Args:
             catalog_url (str): URL of the product catalog page
             
         Returns:
             list: List of product URLs
         """
-        logger.info(f"Getting product URLs from {catalog_url}")
+        logger.info("Getting product URLs from %s", catalog_url)
         
-        base_url = "https://taurbull.com"
+        seen = set()
         product_urls = []
-        current_page = 1
-        has_next_page = True
         
-        while has_next_page:
-            page_url = f"{catalog_url}?page={current_page}"
-            logger.info(f"Scraping catalog page {current_page}: {page_url}")
+        with ThreadPoolExecutor(max_workers=CATALOG_PREFETCH_PAGES) as executor:
+            futures = {}
+            next_page = 1
+            current_page = 1
             
-            try:
-                html = self.get_page_content(page_url)
-                soup = BeautifulSoup(html, "html.parser")
-                
-                # Find product links
-                product_links = []
+            while True:
+                # Keep the prefetch window full
+                while next_page < current_page + CATALOG_PREFETCH_PAGES:
+                    futures[next_page] = executor.submit(self._fetch_catalog_page, f"{catalog_url}?page={next_page}")
+                    next_page += 1
                 
-                # Method 1: Look for a tags that contain product URLs
-                for a_tag in soup.find_all('a', href=re.compile(r'/products/')):
-                    href = a_tag.get('href')
-                    if href and '/products/' in href and '?' not in href:  # Avoid duplicate links with query params
-                        full_url = urljoin(base_url, href)
-                        if full_url not in product_urls and full_url not in product_links:
-                            product_links.append(full_url)
+                logger.info("Scraping catalog page %s: %s?page=%s", current_page, catalog_url, current_page)
                 
-                # Method 2: Extract from product JSON data if available
-                script_tags = soup.select("script:not([src])")
-                for script in script_tags:
-                    script_text = script.string
-                    if script_text and "collection_viewed" in script_text and "productVariants" in script_text:
-                        try:
-                            # Find the section with product URLs
-                            start_idx = script_text.find('"productVariants":[')
-                            if start_idx > 0:
-                                # Extract URLs from the JSON data
-                                for match in re.finditer(r'"url":"(/products/[^"]+)"', script_text[start_idx:]):
-                                    product_path = match.group(1)
-                                    full_url = urljoin(base_url, product_path)
-                                    if full_url not in product_urls and full_url not in product_links:
-                                        product_links.append(full_url)
-                        except Exception as e:
-                            logger.error(f"Error parsing product data from script: {e}")
-                
-                if not product_links:
-                    logger.warning(f"No products found on page {current_page}")
+                try:
+                    html = futures.pop(current_page).result()
+                    page_links, has_next_page = self._parse_catalog_page(html)
+                except Exception as e:
+                    logger.error("Error scraping catalog page %s: %s", current_page, e)
                     break
                 
                 # Add unique URLs to our list
-                for url in product_links:
-                    if url not in product_urls:
+                new_links = 0
+                for url in page_links:
+                    if url not in seen:
+                        seen.add(url)
                         product_urls.append(url)
+                        new_links += 1
+                
+                if not new_links:
+                    logger.warning("No products found on page %s", current_page)
+                    break
                 
-                # Check if there's a next page
-                next_page_link = soup.select_one("a.pagination__item--next")
-                if not next_page_link:
+                if not has_next_page:
                     logger.info("No more pages available")
-                    has_next_page = False
-                else:
-                    current_page += 1
-                    
-            except Exception as e:
-                logger.error(f"Error scraping catalog page {current_page}: {e}")
-                has_next_page = False
+                    break
+                
+                current_page += 1
+            
+            # Drop speculative fetches beyond the last page
+            for future in futures.values():
+                future.cancel()
         
-        logger.info(f"Found {len(product_urls)} product URLs")
+        logger.info("Found %s product URLs", len(product_urls))
         return product_urls
         
+    def _extract_product_text(self, html):
+        """
+        Extract the visible text of a product page.
+        
+        Args:
+            html (str): HTML content of the product page
+            
+        Returns:
+            str: Whitespace-normalized page text
+        """
+        # Parse the HTML with lxml and drop scripts and styles in a single C-level pass
+        doc = lxml.html.fromstring(html)
+        lxml.etree.strip_elements(doc, 'script', 'style', with_tail=False)
+        
+        # Get text and clean it up
+        text = ' '.join(doc.itertext())
+        return _WS_RE.sub(' ', text).strip()
+        
     def scrape_product_content(self, product_url):
         """
         Scrape detailed content for a single product.
@@ -290,40 +632,76 @@ class TaurbullScraper:
         Returns:
             dict: Product data including basic info and full text
         """
-        logger.info(f"Scraping product content from {product_url}")
+        logger.info("Scraping product content from %s", product_url)
         
         try:
             html = self.get_page_content(product_url)
+        except Exception as e:
+            return self._build_product_data(product_url, error=e)
+        return self._build_product_data(product_url, html)
+    
+    def _build_product_data(self, product_url, html=None, error=None):
+        """
+        Build the product data for a downloaded product page.
+        
+        Args:
+            product_url (str): URL of the product page
+            html (str, optional): HTML content of the product page
+            error (Exception, optional): Error raised while fetching the page
             
-            # Parse the HTML and extract text content
-            soup = BeautifulSoup(html, "html.parser")
-            
-            # Remove scripts and styles
-            for script in soup(['script', 'style']):
-                script.extract()
+        Returns:
+            dict: Product data including basic info and full text, or empty
+            fields and the error message if the page could not be scraped
+        """
+        if error is None:
+            try:
+                text = self._extract_product_text(html)
+                
+                # Get basic product info from the already downloaded page
+                basic_info = self._product_scraper.scrape_product_details(product_url, html=html)
+                
+                return {
+                    "basic_info": basic_info,
+                    "full_text": text,
+                    "url": product_url
+                }
             
-            # Get text and clean it up
-            text = soup.get_text(separator=' ').strip()
-            text = re.sub(r'\s+', ' ', text)
+            except Exception as e:
+                error = e
+        
+        logger.error("Error scraping product text from %s: %s", product_url, error)
+        return {
+            "basic_info": {},
+            "full_text": "",
+            "url": product_url,
+            "error": str(error)
+        }
+    
+    async def _scrape_one(self, executor, semaphore, product_url):
+        """
+        Asynchronously scrape detailed content for a single product.
+        
+        The page is fetched in a worker thread through the cached session, so
+        unchanged product pages are served from the HTTP cache. Only the HTTP
+        wait is overlapped with other products; parsing stays synchronous.
+        
+        Args:
+            executor (ThreadPoolExecutor): Worker threads for page fetches
+            semaphore (asyncio.Semaphore): Bounds the number of concurrent products
+            product_url (str): URL of the product page
             
-            # Get basic product info
-            scraper = ProductDetailScraper()
-            basic_info = scraper.scrape_product_details(product_url)
+        Returns:
+            dict: Product data including basic info and full text
+        """
+        async with semaphore:
+            logger.info("Scraping product content from %s", product_url)
             
-            return {
-                "basic_info": basic_info,
-                "full_text": text,
-                "url": product_url
-            }
-        
-        except Exception as e:
-            logger.error(f"Error scraping product text from {product_url}: {e}")
-            return {
-                "basic_info": {},
-                "full_text": "",
-                "url": product_url,
-                "error": str(e)
-            }
+            try:
+                loop = asyncio.get_running_loop()
+                html = await loop.run_in_executor(executor, self.get_page_content, product_url)
+            except Exception as e:
+                return self._build_product_data(product_url, error=e)
+            return self._build_product_data(product_url, html)
             
     def format_product_for_knowledge_base(self, product_data):
         """
@@ -357,9 +735,11 @@ FULL CONTENT:
 """
         return formatted_text
     
-    def scrape_products(self, catalog_url):
+    async def ascrape_products(self, catalog_url):
         """
-        Scrape all products from the catalog and format for knowledge base.
+        Asynchronously scrape all products from the catalog and format for knowledge base.
+        
+        Product pages are fetched concurrently, bounded by MAX_CONCURRENT_PRODUCTS.
         
         Args:
             catalog_url (str): URL of the product catalog
@@ -367,26 +747,48 @@ FULL CONTENT:
         Returns:
             str: Formatted product content for knowledge base
         """
-        logger.info(f"Scraping all products from {catalog_url}")
+        logger.info("Scraping all products from %s", catalog_url)
         
         # Get all product URLs
-        product_urls = self.get_all_product_urls(catalog_url)
+        product_urls = await asyncio.to_thread(self.get_all_product_urls, catalog_url)
         
         if not product_urls:
             logger.warning("No product URLs found")
             return ""
         
-        # Scrape product data from each URL
-        all_product_data = []
-        for i, url in enumerate(product_urls, 1):
-            logger.info(f"Scraping product {i}/{len(product_urls)}: {url}")
-            product_data = self.scrape_product_content(url)
-            all_product_data.append(product_data)
-        
-        # Format data for ElevenLabs knowledge base
-        formatted_content = "# Taurbull Product Catalog\n\n"
-        for product_data in all_product_data:
-            formatted_content += self.format_product_for_knowledge_base(product_data)
+        # Scrape product data from all URLs concurrently
+        logger.info("Scraping %s products", len(product_urls))
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PRODUCTS)
+        
+        async def scrape_indexed(index, url):
+            return index, await self._scrape_one(executor, semaphore, url)
+        
+        # Format each product as soon as it completes so the raw product data
+        # can be released; slots keep the output in catalog order. The loop's
+        # default executor can have fewer threads than the semaphore allows on
+        # small machines, so fetches get a pool of their own.
+        parts = [""] * (len(product_urls) + 1)
+        parts[0] = "# Taurbull Product Catalog\n\n"
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PRODUCTS) as executor:
+            tasks = [scrape_indexed(index, url) for index, url in enumerate(product_urls, 1)]
+            for next_completed in asyncio.as_completed(tasks):
+                index, product_data = await next_completed
+                parts[index] = self.format_product_for_knowledge_base(product_data)
+        
+        formatted_content = "".join(parts)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Scraped %s products with total %s words", len(product_urls), len(formatted_content.split()))
+        return formatted_content
+    
+    def scrape_products(self, catalog_url):
+        """
+        Scrape all products from the catalog and format for knowledge base.
         
-        logger.info(f"Scraped {len(all_product_data)} products with total {len(formatted_content.split())} words")
-        return formatted_content 
\ No newline at end of file
+        Args:
+            catalog_url (str): URL of the product catalog
+            
+        Returns:
+            str: Formatted product content for knowledge base
+        """
+        return asyncio.run(self.ascrape_products(catalog_url))
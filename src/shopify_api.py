@@ -1,12 +1,25 @@
 """
 Shopify API client module for fetching orders data.
 """
+import asyncio
+import hashlib
+import io
 import logging
+import aiohttp
+import ijson
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import re
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Sequence
+from datetime import datetime, timedelta, timezone
 
 # Import using try/except for flexibility
 try:
@@ -16,6 +29,7 @@ try:
         SHOPIFY_API_VERSION,
         SHOPIFY_SHOP_NAME,
         SHOPIFY_ACCESS_TOKEN,
+        CACHE_DIR,
         DEBUG
     )
 except ImportError:
@@ -25,6 +39,7 @@ except ImportError:
         SHOPIFY_API_VERSION,
         SHOPIFY_SHOP_NAME,
         SHOPIFY_ACCESS_TOKEN,
+        CACHE_DIR,
         DEBUG
     )
 
@@ -35,19 +50,313 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Timeout in seconds for Shopify API requests
+REQUEST_TIMEOUT = 30
+
+# Concurrent order detail requests, kept low for Shopify's REST rate limit
+MAX_CONCURRENT_ORDER_REQUESTS = 2
+
+# Optional on-disk cache of Shopify GET responses, see ShopifyClient(use_cache=True)
+SHOPIFY_CACHE_PATH = CACHE_DIR / "shopify_cache"
+SHOPIFY_CACHE_EXPIRE_SECONDS = 3600
+
+# Largest page size accepted by the Shopify REST orders endpoint
+MAX_PAGE_SIZE = 250
+
+# Polling cadence and overall deadline for bulk operations, in seconds
+BULK_POLL_INTERVAL = 2
+BULK_TIMEOUT = 600
+
+# Cursor URL of the next page in a Shopify ``Link`` header
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+# Delivery date (DD-MM-YYYY) stored in order tags
+_DATE_RE = re.compile(r'\d{2}-\d{2}-\d{4}')
+
+# Delivery status shown for each fulfillment status; anything else is not shipped
+_DELIVERY_STATUS = {"fulfilled": "Shipped", "partial": "Partially shipped"}
+
+# Order fields requested from Shopify; only these are read by the formatter
+ORDER_FIELDS = (
+    "id", "order_number", "created_at", "total_price", "currency", "financial_status",
+    "fulfillment_status", "tags", "customer", "line_items", "shipping_address", "shipping_lines",
+    "updated_at"
+)
+
+# Subfields kept from nested order objects
+_CUSTOMER_FIELDS = ("first_name", "last_name", "email")
+_LINE_ITEM_FIELDS = ("title", "variant_title", "quantity", "price")
+_SHIPPING_ADDRESS_FIELDS = ("address1", "address2", "city", "zip", "country")
+
+# Line item fields in the order the formatter unpacks them, with their defaults
+_LI_DEFAULTS = {"title": "Unknown product", "variant_title": "", "quantity": 0, "price": "0.00"}
+_LI_GET = itemgetter(*_LI_DEFAULTS)
+
+
+def _pick(source: Dict[str, Any], keys) -> Dict[str, Any]:
+    """Return a copy of source restricted to the given keys that are present."""
+    return {key: source[key] for key in keys if key in source}
+
+
+def _project(order: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce a Shopify order to the fields used by the formatter.
+    
+    The REST API cannot project nested objects, so customer, line item,
+    address and shipping line payloads are trimmed client-side. Keys that are
+    absent from the order stay absent so formatter defaults still apply.
+    
+    Args:
+        order (Dict[str, Any]): Order as returned by the Shopify API
+        
+    Returns:
+        Dict[str, Any]: Projected order
+    """
+    projected = _pick(order, ORDER_FIELDS)
+    
+    if projected.get("customer"):
+        projected["customer"] = _pick(projected["customer"], _CUSTOMER_FIELDS)
+    if projected.get("shipping_address"):
+        projected["shipping_address"] = _pick(projected["shipping_address"], _SHIPPING_ADDRESS_FIELDS)
+    if projected.get("line_items"):
+        projected["line_items"] = [_pick(item, _LINE_ITEM_FIELDS) for item in projected["line_items"]]
+    if projected.get("shipping_lines"):
+        projected["shipping_lines"] = [_pick(projected["shipping_lines"][0], ("title",))]
+    
+    return projected
+
+
+# Bulk query for orders; nested connections come back as separate JSONL lines
+_BULK_ORDERS_QUERY = """
+{
+  orders(query: "created_at:>=%s", sortKey: CREATED_AT, reverse: true) {
+    edges {
+      node {
+        id
+        legacyResourceId
+        name
+        createdAt
+        updatedAt
+        tags
+        displayFinancialStatus
+        displayFulfillmentStatus
+        totalPriceSet { shopMoney { amount currencyCode } }
+        customer { firstName lastName email }
+        shippingAddress { address1 address2 city zip country }
+        shippingLine { title }
+        lineItems {
+          edges {
+            node {
+              title
+              variantTitle
+              quantity
+              originalUnitPriceSet { shopMoney { amount } }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+_BULK_RUN_MUTATION = """
+mutation bulkOrders($query: String!) {
+  bulkOperationRunQuery(query: $query) {
+    bulkOperation { id status }
+    userErrors { field message }
+  }
+}
+"""
+
+_BULK_STATUS_QUERY = "{ currentBulkOperation(type: QUERY) { id status errorCode url objectCount } }"
+
+# GraphQL fulfillment states mapped to their REST fulfillment_status values
+_GQL_FULFILLMENT_STATUS = {
+    "FULFILLED": "fulfilled",
+    "PARTIALLY_FULFILLED": "partial",
+    "RESTOCKED": "restocked",
+}
+
+
+def _from_graphql(node: Dict[str, Any], line_items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert a bulk operation order node into the REST order shape.
+    
+    Args:
+        node (Dict[str, Any]): Order line from the bulk operation result
+        line_items (List[Dict[str, Any]]): Line item lines whose parent is the order
+        
+    Returns:
+        Dict[str, Any]: Order with the same keys as a projected REST order
+    """
+    money = (node.get("totalPriceSet") or {}).get("shopMoney") or {}
+    customer = node.get("customer")
+    name = node.get("name") or ""
+    
+    order = {
+        "id": int(node["legacyResourceId"]) if node.get("legacyResourceId") else node.get("id"),
+        "order_number": int(name.lstrip("#")) if name.lstrip("#").isdigit() else name,
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "total_price": money.get("amount", "0.00"),
+        "currency": money.get("currencyCode", "EUR"),
+        "financial_status": (node.get("displayFinancialStatus") or "Unknown").lower(),
+        "fulfillment_status": _GQL_FULFILLMENT_STATUS.get(node.get("displayFulfillmentStatus")),
+        "tags": ", ".join(node.get("tags") or []),
+        "shipping_address": node.get("shippingAddress"),
+        "shipping_lines": [node["shippingLine"]] if node.get("shippingLine") else [],
+        "line_items": [
+            {
+                "title": item.get("title"),
+                "variant_title": item.get("variantTitle") or "",
+                "quantity": item.get("quantity", 0),
+                "price": ((item.get("originalUnitPriceSet") or {}).get("shopMoney") or {}).get("amount", "0.00"),
+            }
+            for item in line_items
+        ],
+    }
+    if customer:
+        order["customer"] = {
+            "first_name": customer.get("firstName") or "",
+            "last_name": customer.get("lastName") or "",
+            "email": customer.get("email") or "No email provided",
+        }
+    return order
+
+
+@lru_cache(maxsize=8)
+def _since_iso(since_days: int, bucket: int, bucket_seconds: int = 60) -> str:
+    """
+    Return the UTC ISO-8601 timestamp since_days before the current bucket.
+    
+    Args:
+        since_days (int): Number of days to go back
+        bucket (int): Current time divided by bucket_seconds, so cached
+            values expire with each bucket
+        bucket_seconds (int): Width of a bucket in seconds
+        
+    Returns:
+        str: Timestamp with offset, e.g. 2025-04-01T12:00:00+00:00
+    """
+    start = datetime.fromtimestamp(bucket * bucket_seconds, timezone.utc)
+    return (start - timedelta(days=since_days)).isoformat(timespec="seconds")
+
+
+# Layout of a single order in the knowledge base document
+_ORDER_TMPL = """
+======================================
+ORDER NUMBER: {order_number}
+ID: {order_id}
+DATE: {created_at}
+CUSTOMER: {customer_name}
+EMAIL: {customer_email}
+PAYMENT STATUS: {financial_status}
+FULFILLMENT STATUS: {fulfillment_status}
+DELIVERY STATUS: {delivery_status}
+DELIVERY METHOD: {delivery_method}
+EXPECTED DELIVERY: {delivery_date}
+TOTAL: {total_price} {currency}
+
+{shipping_info}
+
+{products_info}
+======================================
+
+"""
+
+_SHIP_TMPL = """
+SHIPPING ADDRESS:
+{address1}
+{address2}
+{zip} {city}
+{country}
+"""
+
+
+class _SafeDict(dict):
+    """Mapping for str.format_map that renders missing keys as empty strings."""
+
+    def __missing__(self, key):
+        return ""
+
+
+# Formatted knowledge base content keyed by order fingerprint, oldest first
+_fmt_cache: Dict[str, str] = {}
+_FMT_CACHE_SIZE = 32
+
+
+def _orders_fingerprint(orders: Sequence[Dict[str, Any]]) -> Optional[str]:
+    """
+    Compute a digest over the (id, updated_at) pairs of the given orders.
+    
+    Args:
+        orders (Sequence[Dict[str, Any]]): Order dictionaries
+        
+    Returns:
+        Optional[str]: Hex digest, or None if any order lacks updated_at and
+        its content therefore cannot be fingerprinted
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for order in orders:
+        updated_at = order.get("updated_at")
+        if not updated_at:
+            return None
+        digest.update(f"{order.get('id')}:{updated_at}\n".encode())
+    return digest.hexdigest()
+
 
 class ShopifyClient:
     """Client for interacting with the Shopify API to fetch orders."""
 
-    def __init__(self):
-        """Initialize the Shopify API client."""
+    def __init__(self, use_cache: bool = False):
+        """
+        Initialize the Shopify API client.
+        
+        Args:
+            use_cache (bool): Keep GET responses in an on-disk cache for
+                SHOPIFY_CACHE_EXPIRE_SECONDS, e.g. for repeated local test runs
+        """
         self.shop_url = f"https://{SHOPIFY_SHOP_NAME}"
         self.api_version = SHOPIFY_API_VERSION
         self.access_token = SHOPIFY_ACCESS_TOKEN
+        self.use_cache = use_cache
         
         # Check if we have the required credentials
         if not self.access_token:
             logger.warning("Shopify access token not set. API calls will fail.")
+        
+        # Reuse connections to the shop across requests and back off on
+        # rate limiting (429) and transient server errors
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True
+        )
+        if use_cache:
+            # Keep the access token out of the cache file and the cache keys
+            self._session = requests_cache.CachedSession(
+                str(SHOPIFY_CACHE_PATH),
+                backend='sqlite',
+                expire_after=SHOPIFY_CACHE_EXPIRE_SECONDS,
+                ignored_parameters=["X-Shopify-Access-Token"]
+            )
+        else:
+            self._session = requests.Session()
+        self._session.headers.update(self._get_headers())
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry))
+
+    def close(self):
+        """Close the underlying HTTP session and release pooled connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _get_headers(self) -> Dict[str, str]:
         """
@@ -61,45 +370,221 @@ class ShopifyClient:
             "Content-Type": "application/json"
         }
 
-    def get_orders(self, limit: int = 50, since_days: int = 30, status: str = "any") -> List[Dict[str, Any]]:
+    def _get_orders_page(self, url: str, params: Optional[Dict[str, Any]]) -> requests.Response:
+        """Request a page of orders, leaving the body unread for streaming."""
+        return self._session.get(url, params=params, timeout=REQUEST_TIMEOUT, stream=True)
+
+    def iter_orders(self, page_size: int = MAX_PAGE_SIZE, since_days: int = 30,
+                    status: str = "any", prefetch: bool = True) -> Iterator[Dict[str, Any]]:
         """
-        Fetch orders from Shopify.
+        Lazily iterate over orders from Shopify, following cursor pagination.
+        
+        Pages are requested as the caller consumes orders, using the
+        ``rel="next"`` URL from the ``Link`` response header. Cursors cannot be
+        fetched in parallel, but the header arrives before the body, so with
+        prefetch enabled the next page is requested in the background while
+        the current one is still being streamed.
         
         Args:
-            limit (int): Maximum number of orders to fetch
+            page_size (int): Number of orders to request per page (max 250)
             since_days (int): Fetch orders from the last n days
             status (str): Order status filter (any, open, closed, cancelled)
+            prefetch (bool): Request the next page while reading the current one
             
-        Returns:
-            List[Dict[str, Any]]: List of order dictionaries
+        Yields:
+            Dict[str, Any]: Order dictionaries
+            
+        Raises:
+            requests.exceptions.RetryError: If a page still answers 429 or 5xx
+                after retries
+            requests.HTTPError: If a page fails with another error status
+            requests.ConnectionError: If the shop becomes unreachable after the
+                first page; failing to reach it at all yields no orders
         """
-        logger.info(f"Fetching up to {limit} orders with status '{status}' from the last {since_days} days")
+        logger.info(f"Fetching orders with status '{status}' from the last {since_days} days")
         
-        # Calculate the date range
-        created_at_min = (datetime.now() - timedelta(days=since_days)).isoformat()
+        # Calculate the date range. With the response cache enabled the start is
+        # rounded to the cache lifetime so repeated runs produce the same URL.
+        bucket_seconds = SHOPIFY_CACHE_EXPIRE_SECONDS if self.use_cache else 60
+        created_at_min = _since_iso(since_days, int(time.time()) // bucket_seconds, bucket_seconds)
         
         # Build the URL
         url = f"{self.shop_url}/admin/api/{self.api_version}/orders.json"
         
-        # Parameters for the request
+        # Parameters for the first request; later pages carry their own cursor
         params = {
-            "limit": limit,
+            "limit": page_size,
             "status": status,
             "created_at_min": created_at_min,
-            "fields": "id,order_number,created_at,total_price,currency,customer,line_items,shipping_address,financial_status,fulfillment_status,shipping_lines,tags"
+            "fields": ",".join(ORDER_FIELDS)
         }
         
-        try:
-            response = requests.get(url, headers=self._get_headers(), params=params)
-            response.raise_for_status()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self._get_orders_page, url, params)
+            page = 0
+            try:
+                while pending is not None:
+                    # Retryable statuses are handled by the session; anything still
+                    # failing after retries propagates to the caller
+                    try:
+                        response = pending.result()
+                    except requests.ConnectionError as e:
+                        logger.error(f"Error fetching orders from Shopify: {e}")
+                        # Nothing was yielded yet, so callers see no orders. A
+                        # later page failing must not pass for a complete list.
+                        if page:
+                            raise
+                        return
+                    pending = None
+                    
+                    with response:
+                        response.raise_for_status()
+                        
+                        # Follow the cursor to the next page, if any
+                        match = _NEXT_LINK_RE.search(response.headers.get("Link", ""))
+                        next_url = match.group(1) if match else None
+                        if next_url and prefetch:
+                            pending = executor.submit(self._get_orders_page, next_url, None)
+                        
+                        # Parse orders straight off the socket so only one order is held
+                        # in memory at a time; let urllib3 undo any gzip encoding first.
+                        # The response cache has already read the whole body.
+                        if self.use_cache:
+                            body = io.BytesIO(response.content)
+                        else:
+                            response.raw.decode_content = True
+                            body = response.raw
+                        page += 1
+                        page_orders = 0
+                        for order in ijson.items(body, "orders.item", use_float=True):
+                            page_orders += 1
+                            yield _project(order)
+                        logger.info(f"Fetched {page_orders} orders from page {page}")
+                        
+                        if next_url and not prefetch:
+                            pending = executor.submit(self._get_orders_page, next_url, None)
+            finally:
+                # The caller stopped early or a page failed: release the connection
+                # held by a prefetched page that will never be read
+                if pending is not None and not pending.cancel():
+                    try:
+                        pending.result().close()
+                    except requests.RequestException:
+                        pass
+
+    def get_orders(self, limit: int = 50, since_days: int = 30, status: str = "any") -> List[Dict[str, Any]]:
+        """
+        Fetch orders from Shopify.
+        
+        Args:
+            limit (int): Maximum number of orders to fetch
+            since_days (int): Fetch orders from the last n days
+            status (str): Order status filter (any, open, closed, cancelled)
             
-            orders = response.json().get("orders", [])
-            logger.info(f"Successfully fetched {len(orders)} orders")
-            return orders
+        Returns:
+            List[Dict[str, Any]]: List of order dictionaries
             
-        except requests.RequestException as e:
-            logger.error(f"Error fetching orders from Shopify: {e}")
-            return []
+        Raises:
+            requests.RequestException: If a page fails after the first one, so
+                a partial list is never returned; see iter_orders
+        """
+        logger.info(f"Fetching up to {limit} orders with status '{status}' from the last {since_days} days")
+        
+        # Only prefetch when the limit spans more than one page, otherwise the
+        # request for the page after the last one read would be wasted
+        orders_iter = self.iter_orders(page_size=min(limit, MAX_PAGE_SIZE), since_days=since_days,
+                                       status=status, prefetch=limit > MAX_PAGE_SIZE)
+        orders = list(islice(orders_iter, limit))
+        
+        logger.info(f"Successfully fetched {len(orders)} orders")
+        return orders
+
+    def _graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run a query against the Shopify Admin GraphQL API.
+        
+        Args:
+            query (str): GraphQL query or mutation
+            variables (Optional[Dict[str, Any]]): Query variables
+            
+        Returns:
+            Dict[str, Any]: The ``data`` member of the response
+            
+        Raises:
+            requests.HTTPError: If the request fails
+        """
+        url = f"{self.shop_url}/admin/api/{self.api_version}/graphql.json"
+        response = self._session.post(url, json={"query": query, "variables": variables or {}},
+                                      timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("errors"):
+            logger.error(f"Shopify GraphQL errors: {payload['errors']}")
+        return payload.get("data") or {}
+
+    def get_orders_bulk(self, since_days: int = 30) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch all orders through a GraphQL bulk operation.
+        
+        A single bulk query replaces REST pagination for large syncs: Shopify
+        prepares a JSONL export in the background, which is polled for and then
+        streamed. Orders are converted to the REST shape so they can be passed
+        directly to format_orders_for_knowledge_base.
+        
+        Args:
+            since_days (int): Fetch orders from the last n days
+            
+        Yields:
+            Dict[str, Any]: Order dictionaries, newest first
+            
+        Raises:
+            requests.HTTPError: If a request to Shopify fails
+        """
+        logger.info(f"Starting bulk export of orders from the last {since_days} days")
+        
+        query = _BULK_ORDERS_QUERY % _since_iso(since_days, int(time.time()) // 60)
+        result = self._graphql(_BULK_RUN_MUTATION, {"query": query}).get("bulkOperationRunQuery") or {}
+        if result.get("userErrors") or not result.get("bulkOperation"):
+            logger.error(f"Could not start bulk operation: {result.get('userErrors')}")
+            return
+        
+        # Wait for Shopify to finish preparing the export
+        deadline = time.monotonic() + BULK_TIMEOUT
+        while True:
+            operation = self._graphql(_BULK_STATUS_QUERY).get("currentBulkOperation") or {}
+            status = operation.get("status")
+            if status == "COMPLETED":
+                break
+            if status not in ("CREATED", "RUNNING") or time.monotonic() > deadline:
+                logger.error(f"Bulk operation ended with status {status} ({operation.get('errorCode')})")
+                return
+            time.sleep(BULK_POLL_INTERVAL)
+        
+        # An export without matching objects has no result file
+        if not operation.get("url"):
+            logger.info("Bulk operation returned no orders")
+            return
+        
+        # Line items reference their order through __parentId; collect them per
+        # order before converting, keeping the export's order. The file is a
+        # signed storage URL, so the shop access token is not sent along.
+        orders: Dict[str, Dict[str, Any]] = {}
+        line_items: Dict[str, List[Dict[str, Any]]] = {}
+        with requests.get(operation["url"], timeout=REQUEST_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                node = json.loads(line)
+                parent_id = node.get("__parentId")
+                if parent_id:
+                    line_items.setdefault(parent_id, []).append(node)
+                else:
+                    orders[node["id"]] = node
+        
+        logger.info(f"Bulk operation returned {len(orders)} orders")
+        for gid, node in orders.items():
+            yield _from_graphql(node, line_items.get(gid, []))
 
     def get_order_details(self, order_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -116,7 +601,7 @@ class ShopifyClient:
         url = f"{self.shop_url}/admin/api/{self.api_version}/orders/{order_id}.json"
         
         try:
-            response = requests.get(url, headers=self._get_headers())
+            response = self._session.get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             order = response.json().get("order", {})
@@ -127,22 +612,89 @@ class ShopifyClient:
             logger.error(f"Error fetching order {order_id} details: {e}")
             return None
 
-    def format_orders_for_knowledge_base(self, orders: List[Dict[str, Any]]) -> str:
+    async def _fetch_order_details(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                                   order_id: int) -> Optional[Dict[str, Any]]:
         """
-        Format orders data for ElevenLabs knowledge base.
+        Asynchronously fetch details for a specific order.
         
         Args:
-            orders (List[Dict[str, Any]]): List of order dictionaries
+            session (aiohttp.ClientSession): Shared session for the requests
+            semaphore (asyncio.Semaphore): Bounds the number of concurrent requests
+            order_id (int): The ID of the order to fetch
             
         Returns:
-            str: Formatted content for knowledge base
+            Optional[Dict[str, Any]]: Order details or None if not found
+        """
+        url = f"{self.shop_url}/admin/api/{self.api_version}/orders/{order_id}.json"
+        
+        async with semaphore:
+            try:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    data = await response.json()
+                    return data.get("order", {})
+            
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Error fetching order {order_id} details: {e}")
+                return None
+
+    async def get_order_details_many(self, order_ids: List[int]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch details for several orders concurrently.
+        
+        Args:
+            order_ids (List[int]): The IDs of the orders to fetch
+            
+        Returns:
+            List[Optional[Dict[str, Any]]]: Order details in the same order as order_ids,
+            with None for orders that could not be fetched
+        """
+        logger.info(f"Fetching details for {len(order_ids)} orders")
+        
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ORDER_REQUESTS)
+        connector = aiohttp.TCPConnector(limit=4, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        async with aiohttp.ClientSession(connector=connector, headers=self._get_headers(), timeout=timeout) as session:
+            return await asyncio.gather(
+                *[self._fetch_order_details(session, semaphore, order_id) for order_id in order_ids]
+            )
+
+    def get_order_details_many_sync(self, order_ids: List[int]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Synchronous wrapper around get_order_details_many.
+        
+        Args:
+            order_ids (List[int]): The IDs of the orders to fetch
+            
+        Returns:
+            List[Optional[Dict[str, Any]]]: Order details in the same order as order_ids
+        """
+        return asyncio.run(self.get_order_details_many(order_ids))
+
+    def format_orders_stream(self, orders: Iterable[Dict[str, Any]]) -> Iterator[str]:
         """
-        if not orders:
-            return "No orders available."
+        Format orders for the knowledge base one order at a time.
         
-        formatted_content = "# Taurbull Orders\n\n"
+        Orders are consumed lazily, so a generator such as iter_orders can be
+        written out without holding all orders or the whole document in memory.
         
-        for order in orders:
+        Args:
+            orders (Iterable[Dict[str, Any]]): Order dictionaries
+            
+        Yields:
+            str: The document header followed by one chunk per order, or
+            "No orders available." if there are none
+        """
+        order_count = 0
+        total_chars = 0
+        
+        for order in orders or []:
+            if not order_count:
+                header = "# Taurbull Orders\n\n"
+                total_chars += len(header)
+                yield header
+            order_count += 1
+            
             # Extract basic order information
             order_number = order.get("order_number", "Unknown")
             order_id = order.get("id", "Unknown")
@@ -152,16 +704,10 @@ class ShopifyClient:
             financial_status = order.get("financial_status", "Unknown")
             
             # Extract additional fields
-            fulfillment_status = order.get("fulfillment_status", "unfulfilled")
-            if not fulfillment_status:
-                fulfillment_status = "unfulfilled"
+            fulfillment_status = order.get("fulfillment_status") or "unfulfilled"
             
             # Set delivery status based on fulfillment status
-            delivery_status = "Not shipped yet"
-            if fulfillment_status == "fulfilled":
-                delivery_status = "Shipped"
-            elif fulfillment_status == "partial":
-                delivery_status = "Partially shipped"
+            delivery_status = _DELIVERY_STATUS.get(fulfillment_status, "Not shipped yet")
                 
             # Get shipping method/delivery method
             shipping_lines = order.get("shipping_lines", [])
@@ -171,13 +717,10 @@ class ShopifyClient:
             
             # Extract delivery date from tags
             tags = order.get("tags", "")
-            delivery_date = "Not scheduled"
             
             # Look for a date pattern DD-MM-YYYY in tags
-            date_pattern = r'(\d{2}-\d{2}-\d{4})'
-            date_matches = re.findall(date_pattern, tags)
-            if date_matches:
-                delivery_date = date_matches[0]
+            date_match = _DATE_RE.search(tags)
+            delivery_date = date_match.group(0) if date_match else "Not scheduled"
             
             # Extract customer information
             customer = order.get("customer", {})
@@ -186,61 +729,66 @@ class ShopifyClient:
             
             # Extract shipping address
             shipping_address = order.get("shipping_address", {})
-            shipping_info = ""
-            if shipping_address:
-                address1 = shipping_address.get("address1", "")
-                address2 = shipping_address.get("address2", "")
-                city = shipping_address.get("city", "")
-                zip_code = shipping_address.get("zip", "")
-                country = shipping_address.get("country", "")
-                
-                shipping_info = f"""
-SHIPPING ADDRESS:
-{address1}
-{address2}
-{zip_code} {city}
-{country}
-"""
+            shipping_info = _SHIP_TMPL.format_map(_SafeDict(shipping_address)) if shipping_address else ""
             
             # Extract line items (products)
-            line_items = order.get("line_items", [])
-            products_info = "PRODUCTS:\n"
-            
-            for item in line_items:
-                title = item.get("title", "Unknown product")
-                variant_title = item.get("variant_title", "")
-                if variant_title:
-                    product_name = f"{title} - {variant_title}"
-                else:
-                    product_name = title
-                    
-                quantity = item.get("quantity", 0)
-                price = item.get("price", "0.00")
-                
-                products_info += f"- {quantity}x {product_name} ({price} {currency})\n"
+            product_lines = ["PRODUCTS:"]
+            for item in order.get("line_items", []):
+                title, variant_title, quantity, price = _LI_GET({**_LI_DEFAULTS, **item})
+                product_name = f"{title} - {variant_title}" if variant_title else title
+                product_lines.append(f"- {quantity}x {product_name} ({price} {currency})")
+            
+            products_info = "\n".join(product_lines) + "\n"
             
             # Format the order entry with a clear separator
-            order_entry = f"""
-======================================
-ORDER NUMBER: {order_number}
-ID: {order_id}
-DATE: {created_at}
-CUSTOMER: {customer_name}
-EMAIL: {customer_email}
-PAYMENT STATUS: {financial_status}
-FULFILLMENT STATUS: {fulfillment_status}
-DELIVERY STATUS: {delivery_status}
-DELIVERY METHOD: {delivery_method}
-EXPECTED DELIVERY: {delivery_date}
-TOTAL: {total_price} {currency}
-
-{shipping_info}
-
-{products_info}
-======================================
+            chunk = _ORDER_TMPL.format_map({
+                "order_number": order_number,
+                "order_id": order_id,
+                "created_at": created_at,
+                "customer_name": customer_name,
+                "customer_email": customer_email,
+                "financial_status": financial_status,
+                "fulfillment_status": fulfillment_status,
+                "delivery_status": delivery_status,
+                "delivery_method": delivery_method,
+                "delivery_date": delivery_date,
+                "total_price": total_price,
+                "currency": currency,
+                "shipping_info": shipping_info,
+                "products_info": products_info,
+            })
+            total_chars += len(chunk)
+            yield chunk
+        
+        if not order_count:
+            yield "No orders available."
+            return
+        
+        logger.info(f"Formatted {order_count} orders with total {total_chars} chars")
 
-"""
-            formatted_content += order_entry
+    def format_orders_for_knowledge_base(self, orders: Iterable[Dict[str, Any]]) -> str:
+        """
+        Format orders data for ElevenLabs knowledge base.
+        
+        Args:
+            orders (Iterable[Dict[str, Any]]): Order dictionaries, e.g. a list
+                or the generator returned by iter_orders
+            
+        Returns:
+            str: Formatted content for knowledge base
+        """
+        # Reuse the previous result when no order has changed. Streamed
+        # iterables are not cached since fingerprinting would consume them.
+        cache_key = _orders_fingerprint(orders) if isinstance(orders, Sequence) and orders else None
+        if cache_key in _fmt_cache:
+            logger.info(f"Orders unchanged since last format, reusing cached content for {len(orders)} orders")
+            return _fmt_cache[cache_key]
+        
+        formatted_content = "".join(self.format_orders_stream(orders))
+        
+        if cache_key is not None:
+            _fmt_cache[cache_key] = formatted_content
+            if len(_fmt_cache) > _FMT_CACHE_SIZE:
+                _fmt_cache.pop(next(iter(_fmt_cache)))
         
-        logger.info(f"Formatted {len(orders)} orders with total {len(formatted_content.split())} words")
-        return formatted_content 
\ No newline at end of file
+        return formatted_content
@@ -4,6 +4,7 @@ Test script for the legal pages scraper functionality.
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path to allow imports
@@ -23,20 +24,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Set up output directory
+OUTPUT_DIR = Path("test_output")
+OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-def test_legal_page_scraper(url, page_name):
+
+def test_legal_page_scraper(url, page_name, scraper=None):
     """
     Test the legal page scraper on a specific URL.
     
     Args:
         url (str): URL to scrape
         page_name (str): Name of the page for logging
+        scraper (TaurbullScraper, optional): Scraper to reuse; a new one is
+            created if omitted
     """
     logger.info(f"Testing legal page scraper on {page_name}: {url}")
     
     try:
-        # Create scraper
-        scraper = TaurbullScraper()
+        # Create scraper unless one is shared by the caller
+        scraper = scraper or TaurbullScraper()
         
         # Scrape the page
         content = scraper.scrape_legal_page(url)
@@ -46,13 +53,9 @@ def test_legal_page_scraper(url, page_name):
         logger.info(f"Successfully scraped {page_name}. Content length: {len(content)} chars, {word_count} words")
         
         # Save to file for inspection
-        output_dir = Path("test_output")
-        output_dir.mkdir(exist_ok=True)
+        output_file = OUTPUT_DIR / f"{page_name}.txt"
+        output_file.write_text(content, encoding="utf-8")
         
-        output_file = output_dir / f"{page_name}.txt"
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(content)
-            
         logger.info(f"Saved content to {output_file}")
         
     except Exception as e:
@@ -66,14 +69,16 @@ def main():
     """
     logger.info("Starting legal pages scraper test")
     
-    # Create test output directory
-    output_dir = Path("test_output")
-    output_dir.mkdir(exist_ok=True)
-    
-    # Test each legal page
-    test_legal_page_scraper(LEGAL_NOTICE_URL, "legal_notice")
-    test_legal_page_scraper(PRIVACY_POLICY_URL, "privacy_policy")
-    test_legal_page_scraper(TERMS_OF_SERVICE_URL, "terms_of_service")
+    # Test the legal pages concurrently with one scraper so its HTTP session
+    # and pooled connections are shared
+    scraper = TaurbullScraper()
+    pages = [
+        (LEGAL_NOTICE_URL, "legal_notice"),
+        (PRIVACY_POLICY_URL, "privacy_policy"),
+        (TERMS_OF_SERVICE_URL, "terms_of_service"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(pages)) as executor:
+        list(executor.map(lambda page: test_legal_page_scraper(*page, scraper), pages))
     
     logger.info("Legal pages scraper test completed")
 
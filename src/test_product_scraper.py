@@ -4,12 +4,14 @@ Test script for the Taurbull product scraper.
 This script tests the functionality of the product scrapers by running 
 them against the Taurbull website and saving the results to files.
 """
-import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
+
 from src.product_scraper import ProductCatalogScraper, ProductDetailScraper
 
 # Configure logging
@@ -23,12 +25,8 @@ logger = logging.getLogger(__name__)
 
 # Constants
 OUTPUT_DIR = Path("test_output")
-
-def setup_output_dir():
-    """Create the output directory if it doesn't exist."""
-    if not OUTPUT_DIR.exists():
-        OUTPUT_DIR.mkdir(parents=True)
-        logger.info(f"Created output directory: {OUTPUT_DIR}")
+OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+MAX_DETAIL_WORKERS = 8
 
 def test_product_catalog_scraper():
     """Test the product catalog scraper."""
@@ -46,29 +44,29 @@ def test_product_catalog_scraper():
     
     # Save results to files
     catalog_json_path = OUTPUT_DIR / "product_catalog.json"
-    with open(catalog_json_path, "w", encoding="utf-8") as f:
-        json.dump(products, f, indent=2, ensure_ascii=False)
+    catalog_json_path.write_bytes(orjson.dumps(products, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     logger.info(f"Saved catalog JSON to {catalog_json_path}")
     
     # Save a voice-assistant-friendly text format
     catalog_txt_path = OUTPUT_DIR / "product_catalog.txt"
-    with open(catalog_txt_path, "w", encoding="utf-8") as f:
-        f.write("TAURBULL PRODUCT CATALOG\n")
-        f.write("======================\n\n")
-        for i, product in enumerate(products, 1):
-            f.write(f"Product {i}: {product.get('name', 'N/A')}\n")
-            if product.get('full_name') and product.get('full_name') != product.get('name'):
-                f.write(f"Full name: {product.get('full_name')}\n")
-            f.write(f"Price: {product.get('price', 'N/A')}\n")
-            if product.get('price_per_kilo'):
-                f.write(f"Price per kilo: {product.get('price_per_kilo')}\n")
-            if product.get('price_per_unit'):
-                f.write(f"Price per unit: {product.get('price_per_unit')}\n")
-            if product.get('special_offer'):
-                f.write(f"Special offer: {product.get('special_offer')}\n")
-            if product.get('description'):
-                f.write(f"Description: {product.get('description')}\n")
-            f.write("\n")
+    lines = []
+    lines.append("TAURBULL PRODUCT CATALOG\n")
+    lines.append("======================\n\n")
+    for i, product in enumerate(products, 1):
+        lines.append(f"Product {i}: {product.get('name', 'N/A')}\n")
+        if product.get('full_name') and product.get('full_name') != product.get('name'):
+            lines.append(f"Full name: {product.get('full_name')}\n")
+        lines.append(f"Price: {product.get('price', 'N/A')}\n")
+        if product.get('price_per_kilo'):
+            lines.append(f"Price per kilo: {product.get('price_per_kilo')}\n")
+        if product.get('price_per_unit'):
+            lines.append(f"Price per unit: {product.get('price_per_unit')}\n")
+        if product.get('special_offer'):
+            lines.append(f"Special offer: {product.get('special_offer')}\n")
+        if product.get('description'):
+            lines.append(f"Description: {product.get('description')}\n")
+        lines.append("\n")
+    catalog_txt_path.write_text("".join(lines), encoding="utf-8")
     logger.info(f"Saved catalog text to {catalog_txt_path}")
     
     # Print sample products to console
@@ -101,37 +99,37 @@ def test_product_detail_scraper():
     
     # Save results to file
     detail_json_path = OUTPUT_DIR / "product_detail_sample.json"
-    with open(detail_json_path, "w", encoding="utf-8") as f:
-        json.dump(product_details, f, indent=2, ensure_ascii=False)
+    detail_json_path.write_bytes(orjson.dumps(product_details, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     logger.info(f"Saved product details to {detail_json_path}")
     
     # Save a voice-assistant-friendly version
     detail_txt_path = OUTPUT_DIR / "product_detail_sample.txt"
-    with open(detail_txt_path, "w", encoding="utf-8") as f:
-        f.write(f"PRODUCT: {product_details.get('name', 'Unknown')}\n")
-        if product_details.get('full_name') and product_details.get('full_name') != product_details.get('name'):
-            f.write(f"Full name: {product_details.get('full_name')}\n")
-        f.write("=================================================\n\n")
-        if product_details.get('price'):
-            f.write(f"Price: {product_details.get('price')}\n")
-        if product_details.get('price_per_kilo'):
-            f.write(f"Price per kilo: {product_details.get('price_per_kilo')}\n")
-        if product_details.get('price_per_unit'):
-            f.write(f"Price per unit: {product_details.get('price_per_unit')}\n")
-        if product_details.get('availability'):
-            f.write(f"Availability: {product_details.get('availability')}\n")
-        if product_details.get('categories'):
-            f.write(f"Categories: {', '.join(product_details.get('categories'))}\n")
-        if product_details.get('description'):
-            f.write(f"\nDescription:\n{product_details.get('description')}\n")
-        if product_details.get('features'):
-            f.write("\nKey Features:\n")
-            for feature in product_details.get('features'):
-                f.write(f"- {feature}\n")
-        if product_details.get('cooking_instructions'):
-            f.write(f"\nCooking Instructions:\n{product_details.get('cooking_instructions')}\n")
-        if product_details.get('ingredients'):
-            f.write(f"\nIngredients:\n{product_details.get('ingredients')}\n")
+    lines = []
+    lines.append(f"PRODUCT: {product_details.get('name', 'Unknown')}\n")
+    if product_details.get('full_name') and product_details.get('full_name') != product_details.get('name'):
+        lines.append(f"Full name: {product_details.get('full_name')}\n")
+    lines.append("=================================================\n\n")
+    if product_details.get('price'):
+        lines.append(f"Price: {product_details.get('price')}\n")
+    if product_details.get('price_per_kilo'):
+        lines.append(f"Price per kilo: {product_details.get('price_per_kilo')}\n")
+    if product_details.get('price_per_unit'):
+        lines.append(f"Price per unit: {product_details.get('price_per_unit')}\n")
+    if product_details.get('availability'):
+        lines.append(f"Availability: {product_details.get('availability')}\n")
+    if product_details.get('categories'):
+        lines.append(f"Categories: {', '.join(product_details.get('categories'))}\n")
+    if product_details.get('description'):
+        lines.append(f"\nDescription:\n{product_details.get('description')}\n")
+    if product_details.get('features'):
+        lines.append("\nKey Features:\n")
+        for feature in product_details.get('features'):
+            lines.append(f"- {feature}\n")
+    if product_details.get('cooking_instructions'):
+        lines.append(f"\nCooking Instructions:\n{product_details.get('cooking_instructions')}\n")
+    if product_details.get('ingredients'):
+        lines.append(f"\nIngredients:\n{product_details.get('ingredients')}\n")
+    detail_txt_path.write_text("".join(lines), encoding="utf-8")
     logger.info(f"Saved product details text to {detail_txt_path}")
     
     # Print product details to console in voice-assistant-friendly format
@@ -169,75 +167,82 @@ def test_full_product_details(max_products=5):
     products_to_scrape = products[:min(max_products, len(products))]
     logger.info(f"Will scrape details for {len(products_to_scrape)} products")
     
-    # Scrape details for each product
-    all_product_details = []
-    for i, product in enumerate(products_to_scrape, 1):
+    # Scrape details for each product in parallel; the requests are I/O bound
+    # and share the detail scraper's session
+    def scrape_one(indexed_product):
+        i, product = indexed_product
         url = product.get("url")
         if not url:
             logger.warning(f"Product {i} has no URL, skipping")
-            continue
+            return None
         
         logger.info(f"Scraping product {i}/{len(products_to_scrape)}: {product.get('name', 'Unknown')}")
         try:
             product_details = detail_scraper.scrape_product_details(url)
-            
-            # Create a voice-assistant-friendly version by removing the URL
-            if "url" in product_details:
-                del product_details["url"]
-            
-            # Transfer any data from catalog that might be missing in detail page
-            if "special_offer" not in product_details and "special_offer" in product:
-                product_details["special_offer"] = product["special_offer"]
-                
-            all_product_details.append(product_details)
         except Exception as e:
             logger.error(f"Error scraping details for product {i}: {e}")
+            return None
+        
+        # Create a voice-assistant-friendly version by removing the URL
+        if "url" in product_details:
+            del product_details["url"]
+        
+        # Transfer any data from catalog that might be missing in detail page
+        if "special_offer" not in product_details and "special_offer" in product:
+            product_details["special_offer"] = product["special_offer"]
+        
+        return product_details
+    
+    # executor.map keeps the catalog order in the output files
+    with ThreadPoolExecutor(max_workers=MAX_DETAIL_WORKERS) as executor:
+        results = executor.map(scrape_one, enumerate(products_to_scrape, 1))
+        all_product_details = [details for details in results if details is not None]
     
     # Save all product details to a file
     all_details_json_path = OUTPUT_DIR / "all_product_details.json"
-    with open(all_details_json_path, "w", encoding="utf-8") as f:
-        json.dump(all_product_details, f, indent=2, ensure_ascii=False)
+    all_details_json_path.write_bytes(orjson.dumps(all_product_details, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     logger.info(f"Saved all product details to {all_details_json_path}")
     
     # Save a more readable text version for voice assistant
     all_details_txt_path = OUTPUT_DIR / "all_product_details.txt"
-    with open(all_details_txt_path, "w", encoding="utf-8") as f:
-        f.write("TAURBULL PRODUCT CATALOG - DETAILED\n")
-        f.write("===================================\n\n")
-        for i, details in enumerate(all_product_details, 1):
-            f.write(f"PRODUCT {i}: {details.get('name', 'N/A')}\n")
-            if details.get('full_name') and details.get('full_name') != details.get('name'):
-                f.write(f"Full name: {details.get('full_name')}\n")
-            f.write("-" * 50 + "\n")
-            
-            # Basic Product Information
-            if details.get('price'):
-                f.write(f"Price: {details.get('price')}\n")
-            if details.get('price_per_kilo'):
-                f.write(f"Price per kilo: {details.get('price_per_kilo')}\n")
-            if details.get('price_per_unit'):
-                f.write(f"Price per unit: {details.get('price_per_unit')}\n")
-            if details.get('availability'):
-                f.write(f"Availability: {details.get('availability')}\n")
-            if details.get('special_offer'):
-                f.write(f"Special offer: {details.get('special_offer')}\n")
-            
-            # Product Details
-            if details.get('description'):
-                f.write(f"\nDescription: {details.get('description')}\n")
-            
-            if details.get('features'):
-                f.write("\nKey Features:\n")
-                for feature in details.get('features'):
-                    f.write(f"- {feature}\n")
-            
-            if details.get('cooking_instructions'):
-                f.write(f"\nCooking Instructions: {details.get('cooking_instructions')}\n")
-            
-            if details.get('ingredients'):
-                f.write(f"\nIngredients: {details.get('ingredients')}\n")
-            
-            f.write("\n" + "=" * 80 + "\n\n")
+    lines = []
+    lines.append("TAURBULL PRODUCT CATALOG - DETAILED\n")
+    lines.append("===================================\n\n")
+    for i, details in enumerate(all_product_details, 1):
+        lines.append(f"PRODUCT {i}: {details.get('name', 'N/A')}\n")
+        if details.get('full_name') and details.get('full_name') != details.get('name'):
+            lines.append(f"Full name: {details.get('full_name')}\n")
+        lines.append("-" * 50 + "\n")
+        
+        # Basic Product Information
+        if details.get('price'):
+            lines.append(f"Price: {details.get('price')}\n")
+        if details.get('price_per_kilo'):
+            lines.append(f"Price per kilo: {details.get('price_per_kilo')}\n")
+        if details.get('price_per_unit'):
+            lines.append(f"Price per unit: {details.get('price_per_unit')}\n")
+        if details.get('availability'):
+            lines.append(f"Availability: {details.get('availability')}\n")
+        if details.get('special_offer'):
+            lines.append(f"Special offer: {details.get('special_offer')}\n")
+        
+        # Product Details
+        if details.get('description'):
+            lines.append(f"\nDescription: {details.get('description')}\n")
+        
+        if details.get('features'):
+            lines.append("\nKey Features:\n")
+            for feature in details.get('features'):
+                lines.append(f"- {feature}\n")
+        
+        if details.get('cooking_instructions'):
+            lines.append(f"\nCooking Instructions: {details.get('cooking_instructions')}\n")
+        
+        if details.get('ingredients'):
+            lines.append(f"\nIngredients: {details.get('ingredients')}\n")
+        
+        lines.append("\n" + "=" * 80 + "\n\n")
+    all_details_txt_path.write_text("".join(lines), encoding="utf-8")
     
     logger.info(f"Saved all product details text to {all_details_txt_path}")
     
@@ -264,9 +269,6 @@ def main():
     """Run the test functions."""
     logger.info("Starting product scraper tests")
     
-    # Create output directory
-    setup_output_dir()
-    
     try:
         # Test catalog scraper
         catalog_products = test_product_catalog_scraper()
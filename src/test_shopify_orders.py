@@ -1,12 +1,14 @@
 """
 Test script for the Shopify orders feature.
 """
+import asyncio
 import os
 import sys
-import json
 import logging
 from pathlib import Path
 
+import orjson
+
 # Add the parent directory to sys.path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
@@ -27,103 +29,104 @@ logger = logging.getLogger(__name__)
 
 # Set up output directory
 OUTPUT_DIR = Path("test_output")
+OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 # ElevenLabs agent ID to assign knowledge base documents to
 AGENT_ID = "2AmUavf0llkEhjBRMstL"  # Use the same agent ID as in main.py
 
 
-def setup_output_dir():
-    """
-    Set up the output directory for test results.
-    """
-    if not OUTPUT_DIR.exists():
-        OUTPUT_DIR.mkdir(parents=True)
-        logger.info(f"Created output directory at {OUTPUT_DIR}")
-    else:
-        logger.info(f"Using existing output directory at {OUTPUT_DIR}")
-
-
-def test_fetch_orders(limit=10, days=30):
+def test_fetch_orders(limit=10, days=30, use_cache=False):
     """
     Test fetching orders from Shopify.
     
     Args:
         limit (int): Maximum number of orders to fetch
         days (int): Fetch orders from the last n days
+        use_cache (bool): Reuse Shopify responses cached by earlier runs. The
+            cache file holds customer data, so it is off unless requested
     """
-    logger.info(f"Testing Shopify orders API with limit={limit}, days={days}")
+    logger.info("Testing Shopify orders API with limit=%s, days=%s", limit, days)
     
     # Initialize the ShopifyClient
-    client = ShopifyClient()
+    client = ShopifyClient(use_cache=use_cache)
     
     # Fetch orders
     orders = client.get_orders(limit=limit, since_days=days)
     
     # Save the raw orders data
     orders_file = OUTPUT_DIR / "shopify_orders_raw.json"
-    with open(orders_file, 'w', encoding='utf-8') as f:
-        json.dump(orders, f, indent=2)
-    logger.info(f"Saved raw orders data to {orders_file}")
+    orders_file.write_bytes(orjson.dumps(orders, option=orjson.OPT_INDENT_2))
+    logger.info("Saved raw orders data to %s", orders_file)
     
     # Format orders for knowledge base
     formatted_orders = client.format_orders_for_knowledge_base(orders)
     
     # Save the formatted orders
     formatted_file = OUTPUT_DIR / "shopify_orders_formatted.txt"
-    with open(formatted_file, 'w', encoding='utf-8') as f:
-        f.write(formatted_orders)
-    logger.info(f"Saved formatted orders to {formatted_file}")
+    formatted_file.write_text(formatted_orders, encoding='utf-8')
+    logger.info("Saved formatted orders to %s", formatted_file)
     
     return orders, formatted_orders
 
 
-def test_update_knowledge_base(formatted_orders):
+def test_update_knowledge_base(formatted_orders, client=None):
     """
     Test updating the ElevenLabs knowledge base with orders.
     
     Args:
         formatted_orders (str): Formatted orders content
+        client (ElevenLabsClient, optional): Client to reuse; a new one is
+            created if omitted
     """
     logger.info("Testing update of ElevenLabs knowledge base with orders")
     
-    # Initialize the ElevenLabsClient
-    client = ElevenLabsClient()
+    # Initialize the ElevenLabsClient unless one is shared by the caller
+    client = client or ElevenLabsClient()
     
-    # Update the knowledge base
-    success = client.update_knowledge_base(
-        "orders", 
-        formatted_orders, 
-        force_update=True,
-        agent_id=AGENT_ID
+    # Update the knowledge base; further documents can be added to the same
+    # batch and are uploaded concurrently with a single agent update
+    results = client.update_knowledge_base_batch(
+        {"orders": formatted_orders},
+        agent_id=AGENT_ID,
+        force_update=True
     )
+    success = all(results.values())
     
     if success:
-        logger.info(f"Successfully updated 'orders' in knowledge base and assigned to agent {AGENT_ID}")
+        logger.info("Successfully updated 'orders' in knowledge base and assigned to agent %s", AGENT_ID)
     else:
         logger.error("Failed to update knowledge base with orders")
     
     return success
 
 
-def main():
+async def main():
     """
     Main entry point for the test script.
     """
     logger.info("Starting Shopify orders test script")
     
-    # Set up the output directory
-    setup_output_dir()
+    # Pass --cache to reuse responses from earlier runs while iterating locally
+    use_cache = "--cache" in sys.argv[1:]
+    
+    elevenlabs_client = ElevenLabsClient()
     
     try:
-        # Test fetching orders
-        orders, formatted_orders = test_fetch_orders(limit=10, days=30)
+        # Fetching orders and checking the ElevenLabs account are independent,
+        # so run both blocking clients side by side
+        (orders, formatted_orders), user_info = await asyncio.gather(
+            asyncio.to_thread(test_fetch_orders, limit=10, days=30, use_cache=use_cache),
+            asyncio.to_thread(elevenlabs_client.get_user_info)
+        )
         
         if orders:
-            logger.info(f"Successfully fetched {len(orders)} orders")
+            logger.info("Successfully fetched %s orders", len(orders))
             
-            # Test updating knowledge base
-            if formatted_orders:
-                success = test_update_knowledge_base(formatted_orders)
+            # Test updating knowledge base, only with a working ElevenLabs account
+            if user_info is None:
+                logger.error("Could not verify ElevenLabs account, skipping knowledge base update")
+            elif formatted_orders:
+                success = await asyncio.to_thread(test_update_knowledge_base, formatted_orders, elevenlabs_client)
                 if success:
                     logger.info("All tests completed successfully")
                 else:
@@ -134,8 +137,8 @@ def main():
             logger.error("Failed to fetch any orders")
     
     except Exception as e:
-        logger.error(f"Error during testing: {e}", exc_info=True)
+        logger.error("Error during testing: %s", e, exc_info=True)
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    asyncio.run(main()) 
\ No newline at end of file
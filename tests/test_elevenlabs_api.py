@@ -0,0 +1,70 @@
+"""
+Tests for the ElevenLabsClient class.
+"""
+from unittest.mock import patch
+
+# Import using try/except for flexibility
+try:
+    from src.elevenlabs_api import ElevenLabsClient
+except ImportError:
+    from elevenlabs_api import ElevenLabsClient
+
+
+class TestElevenLabsClient:
+    """Test suite for the ElevenLabsClient class."""
+
+    def test_update_knowledge_base_batch(self):
+        """Test that a batch replaces each document and updates the agent once."""
+        client = ElevenLabsClient(api_key="test-key")
+        existing_docs = [
+            {"id": "old-faq", "name": "faq.txt"},
+            {"id": "terms", "name": "terms_of_service.txt"},
+        ]
+        agent = {"conversation_config": {"agent": {"prompt": {"knowledge_base": [
+            {"id": "old-faq"}, {"id": "terms"}
+        ]}}}}
+        uploaded = {"faq": {"document_id": "new-faq"}, "orders": {"id": "new-orders"}}
+
+        with patch.object(client, 'get_knowledge_base_docs', return_value=existing_docs) as mock_docs, \
+                patch.object(client, 'delete_knowledge_base_doc', return_value=True) as mock_delete, \
+                patch.object(client, 'add_to_knowledge_base', side_effect=lambda name, *_, **__: uploaded[name]), \
+                patch.object(client, 'get_agent', return_value=agent), \
+                patch.object(client, 'update_agent_knowledge_base', return_value=True) as mock_update:
+            results = client.update_knowledge_base_batch(
+                {"faq": "Q: ?\nA: !", "orders": "# Taurbull Orders"},
+                agent_id="agent-1"
+            )
+
+        assert results == {"faq": True, "orders": True}
+        mock_docs.assert_called_once()
+        mock_delete.assert_called_once_with("old-faq")
+        mock_update.assert_called_once()
+        agent_id, kb_ids = mock_update.call_args.args
+        assert agent_id == "agent-1"
+        assert sorted(kb_ids) == ["new-faq", "new-orders", "terms"]
+
+    def test_update_knowledge_base_batch_failed_upload(self):
+        """Test that a deleted document is detached even if its upload fails."""
+        client = ElevenLabsClient(api_key="test-key")
+        existing_docs = [
+            {"id": "old-faq", "name": "faq.txt"},
+            {"id": "terms", "name": "terms_of_service.txt"},
+        ]
+        agent = {"conversation_config": {"agent": {"prompt": {"knowledge_base": [
+            {"id": "old-faq"}, {"id": "terms"}
+        ]}}}}
+        uploaded = {"faq": None, "orders": {}}
+
+        with patch.object(client, 'get_knowledge_base_docs', return_value=existing_docs), \
+                patch.object(client, 'delete_knowledge_base_doc', return_value=True), \
+                patch.object(client, 'add_to_knowledge_base', side_effect=lambda name, *_, **__: uploaded[name]), \
+                patch.object(client, 'get_agent', return_value=agent), \
+                patch.object(client, 'update_agent_knowledge_base', return_value=True) as mock_update:
+            results = client.update_knowledge_base_batch(
+                {"faq": "Q: ?\nA: !", "orders": "# Taurbull Orders"},
+                agent_id="agent-1"
+            )
+
+        # An upload without a document ID still counts as a success
+        assert results == {"faq": False, "orders": True}
+        mock_update.assert_called_once_with("agent-1", ["terms"])
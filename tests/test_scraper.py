@@ -4,6 +4,7 @@ Tests for the TaurbullScraper class.
 import pytest
 from unittest.mock import patch, MagicMock
 import json
+import lxml.html
 
 # Import using try/except for flexibility
 try:
@@ -12,7 +13,7 @@ except ImportError:
     from scraper import TaurbullScraper
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_faq_html():
     """Sample HTML content with FAQ JSON-LD data."""
     return """
@@ -53,7 +54,7 @@ def sample_faq_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_individual_question_html():
     """Sample HTML content with individual Question JSON-LD data."""
     return """
@@ -81,26 +82,59 @@ def sample_individual_question_html():
     """
 
 
+@pytest.fixture(scope="module")
+def sample_faq_tree(sample_faq_html):
+    """Sample FAQ page parsed once with lxml."""
+    return lxml.html.fromstring(sample_faq_html)
+
+
+@pytest.fixture(scope="module")
+def ok_response():
+    """Successful page response shared by the tests in this module."""
+    response = MagicMock()
+    response.text = "Sample content"
+    response.raise_for_status.return_value = None
+    return response
+
+
+@pytest.fixture(scope="module", autouse=True)
+def http_cache_path(tmp_path_factory):
+    """Keep the scraper's HTTP cache out of the working tree."""
+    path = tmp_path_factory.mktemp("cache") / "http_cache"
+    with patch(f"{TaurbullScraper.__module__}.HTTP_CACHE_PATH", path):
+        yield path
+
+
+@pytest.fixture(scope="module")
+def scraper(http_cache_path):
+    """Scraper instance shared by the tests in this module."""
+    return TaurbullScraper()
+
+
 class TestTaurbullScraper:
     """Test suite for the TaurbullScraper class."""
     
-    def test_get_page_content(self):
+    def test_get_page_content(self, scraper, ok_response):
         """Test fetching page content."""
-        with patch('requests.get') as mock_get:
-            mock_response = MagicMock()
-            mock_response.text = "Sample content"
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
+        with patch.object(scraper._session, 'get') as mock_get:
+            mock_get.return_value = ok_response
             
-            scraper = TaurbullScraper()
             content = scraper.get_page_content("https://example.com")
             
             assert content == "Sample content"
             mock_get.assert_called_once()
     
-    def test_extract_faq_content_faqpage(self, sample_faq_html):
+    def test_get_page_content_stream_bypasses_cache(self, scraper):
+        """Test that streamed pages are not read in full by the HTTP cache."""
+        with patch.object(scraper._session, 'get') as mock_cached_get, \
+                patch.object(scraper._stream_session, 'get') as mock_stream_get:
+            response = scraper.get_page_content("https://example.com", stream=True)
+        
+        assert response is mock_stream_get.return_value
+        mock_cached_get.assert_not_called()
+    
+    def test_extract_faq_content_faqpage(self, scraper, sample_faq_html):
         """Test extracting FAQ content from FAQPage format."""
-        scraper = TaurbullScraper()
         content = scraper.extract_faq_content(sample_faq_html)
         
         # Check content includes both questions and answers
@@ -109,25 +143,168 @@ class TestTaurbullScraper:
         assert "Q: Sample Question 2?" in content
         assert "A: Sample Answer 2" in content
     
-    def test_extract_faq_content_individual_question(self, sample_individual_question_html):
+    def test_extract_faq_content_parsed_tree(self, scraper, sample_faq_html, sample_faq_tree):
+        """Test extracting FAQ content from an already parsed lxml document."""
+        content = scraper.extract_faq_content(sample_faq_tree)
+        
+        assert content == scraper.extract_faq_content(sample_faq_html)
+        assert content.startswith("Q: Sample Question 1?\nA: Sample Answer 1")
+    
+    def test_extract_faq_content_individual_question(self, scraper, sample_individual_question_html):
         """Test extracting FAQ content from individual Question format."""
-        scraper = TaurbullScraper()
         content = scraper.extract_faq_content(sample_individual_question_html)
         
         # Check content includes the question and answer
         assert "Q: Individual Question?" in content
         assert "A: Individual Answer" in content
     
-    def test_scrape_faq(self):
+    def test_extract_faq_content_skips_unrelated_jsonld(self, scraper, sample_individual_question_html):
+        """Test that JSON-LD blocks without questions are not decoded."""
+        html = sample_individual_question_html.replace(
+            '<title>',
+            '<script type="application/ld+json">{"@type": "Organization", broken</script><title>'
+        )
+        
+        with patch(f"{TaurbullScraper.__module__}._parse_jsonld_scripts") as mock_parse:
+            content = scraper.extract_faq_content(html)
+        
+        mock_parse.assert_not_called()
+        assert content == "Q: Individual Question?\nA: Individual Answer"
+    
+    def test_extract_faq_content_reuses_unchanged_page(self, scraper, sample_faq_html):
+        """Test that extracting an unchanged page is served from the cache."""
+        first = scraper.extract_faq_content(sample_faq_html)
+        
+        with patch(f"{TaurbullScraper.__module__}._load_jsonld") as mock_load:
+            assert scraper.extract_faq_content(sample_faq_html) == first
+        mock_load.assert_not_called()
+    
+    def test_extract_faq_content_unquoted_type(self, scraper, sample_individual_question_html):
+        """Test that JSON-LD scripts missed by the regex are found by the parser."""
+        html = sample_individual_question_html.replace('type="application/ld+json"', 'type=application/ld+json')
+        content = scraper.extract_faq_content(html)
+        
+        assert "Q: Individual Question?" in content
+        assert "A: Individual Answer" in content
+    
+    def test_extract_faq_content_skips_commented_out_script(self, scraper, sample_individual_question_html):
+        """Test that a broken regex match falls back to parser-based extraction."""
+        html = sample_individual_question_html.replace(
+            '<title>',
+            '<!-- <script type="application/ld+json">{"@type": </script> --><title>'
+        )
+        content = scraper.extract_faq_content(html)
+        
+        assert content.startswith("Q: Individual Question?")
+        assert "A: Individual Answer" in content
+    
+    def test_scrape_faq(self, scraper, ok_response):
         """Test the full FAQ scraping process."""
-        with patch.object(TaurbullScraper, 'get_page_content') as mock_get_content:
-            with patch.object(TaurbullScraper, 'extract_faq_content') as mock_extract:
-                mock_get_content.return_value = "Sample HTML"
+        with patch.object(scraper._session, 'get') as mock_get:
+            with patch.object(scraper, 'extract_faq_content') as mock_extract:
+                mock_get.return_value = ok_response
                 mock_extract.return_value = "Formatted FAQ Content"
                 
-                scraper = TaurbullScraper()
                 result = scraper.scrape_faq("https://example.com/faq")
                 
                 assert result == "Formatted FAQ Content"
-                mock_get_content.assert_called_once_with("https://example.com/faq")
-                mock_extract.assert_called_once_with("Sample HTML") 
\ No newline at end of file
+                mock_get.assert_called_once()
+                assert mock_get.call_args.args[0] == "https://example.com/faq"
+                mock_extract.assert_called_once_with("Sample content")
+    
+    def test_scrape_faqs(self, scraper, sample_faq_html):
+        """Test scraping several FAQ pages concurrently."""
+        urls = ["https://example.com/faq", "https://example.com/faq-de", "https://example.com/faq"]
+        
+        with patch.object(scraper, 'get_page_content', return_value=sample_faq_html) as mock_get:
+            results = scraper.scrape_faqs(urls)
+        
+        assert list(results) == ["https://example.com/faq", "https://example.com/faq-de"]
+        assert all("Q: Sample Question 1?" in content for content in results.values())
+        assert mock_get.call_count == 2
+    
+    def test_scrape_products(self):
+        """Test scraping all products concurrently keeps catalog order."""
+        product_urls = [
+            "https://taurbull.com/products/brisket",
+            "https://taurbull.com/products/picanha",
+        ]
+        
+        def fake_get_page_content(url):
+            return f"<html><body><p>Page for {url}</p><script>var x = 1;</script></body></html>"
+        
+        with patch.object(TaurbullScraper, 'get_all_product_urls', return_value=product_urls), \
+                patch.object(TaurbullScraper, 'get_page_content', side_effect=fake_get_page_content), \
+                patch(f"{TaurbullScraper.__module__}.ProductDetailScraper") as mock_detail_scraper:
+            mock_detail_scraper.return_value.scrape_product_details.side_effect = (
+                lambda url, html=None: {"name": url.rsplit("/", 1)[-1].title(), "price": "€10.00"}
+            )
+            
+            scraper = TaurbullScraper()
+            result = scraper.scrape_products("https://taurbull.com/collections/all")
+        
+        assert result.startswith("# Taurbull Product Catalog")
+        assert "PRODUCT: Brisket" in result
+        assert "PRODUCT: Picanha" in result
+        assert result.index("PRODUCT: Brisket") < result.index("PRODUCT: Picanha")
+        assert "Page for https://taurbull.com/products/picanha" in result
+        assert "var x" not in result
+        
+        # Product pages are downloaded once and handed to the detail scraper
+        detail_calls = mock_detail_scraper.return_value.scrape_product_details.call_args_list
+        assert [call.kwargs["html"] is not None for call in detail_calls] == [True, True]
+    
+    def test_get_all_product_urls(self):
+        """Test collecting product URLs across catalog pages."""
+        pages = {
+            "https://taurbull.com/collections/all?page=1": """
+                <style>.pagination__item--next { color: #000; }</style>
+                <a href="/products/brisket">Brisket</a>
+                <a href="/products/brisket">Brisket</a>
+                <a href="/products/picanha?view=quick-view">Picanha</a>
+                <a class="pagination__item--next" href="?page=2">Next</a>
+            """,
+            "https://taurbull.com/collections/all?page=2": """
+                <script>{"classes": {"next": "pagination__item--next"}}</script>
+                <a href="/products/picanha">Picanha</a>
+                <a href="/products/brisket">Brisket</a>
+            """,
+        }
+        
+        responses = {}
+        
+        def fake_get_page_content(url, stream=False):
+            # Stream each page in small chunks to exercise early termination
+            html = pages.get(url, "")
+            response = MagicMock()
+            response.encoding = "utf-8"
+            response.iter_content.return_value = [html[i:i + 16] for i in range(0, len(html), 16)]
+            responses[url] = response
+            return response
+        
+        with patch.object(TaurbullScraper, 'get_page_content', side_effect=fake_get_page_content):
+            scraper = TaurbullScraper()
+            urls = scraper.get_all_product_urls("https://taurbull.com/collections/all")
+        
+        assert urls == [
+            "https://taurbull.com/products/brisket",
+            "https://taurbull.com/products/picanha",
+        ]
+        assert all(response.close.called for response in responses.values())
+    
+    def test_extract_legal_page_content(self, scraper):
+        """Test legal page headings and paragraphs keep their source order."""
+        html = """
+        <html><body>
+            <header><p>Navigation</p></header>
+            <main>
+                <h1>Impressum</h1>
+                <p>Taurbull GmbH</p>
+                <h2>Kontakt</h2>
+                <p>E-Mail: info@taurbull.com</p>
+            </main>
+        </body></html>
+        """
+        content = scraper.extract_legal_page_content(html)
+        
+        assert content == "# Impressum\n\nTaurbull GmbH\n\n## Kontakt\n\nE-Mail: info@taurbull.com"
@@ -0,0 +1,336 @@
+"""
+Tests for the ShopifyClient class.
+"""
+import asyncio
+import io
+import json
+import threading
+import aiohttp
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+
+# Import using try/except for flexibility
+try:
+    from src.shopify_api import ShopifyClient
+except ImportError:
+    from shopify_api import ShopifyClient
+
+
+@pytest.fixture
+def sample_orders():
+    """Sample Shopify orders as returned by the REST API."""
+    return [
+        {
+            "id": 6683975942490,
+            "order_number": 1025,
+            "created_at": "2025-04-22T00:18:09+02:00",
+            "total_price": "80.77",
+            "currency": "EUR",
+            "customer": {
+                "first_name": "Simon",
+                "last_name": "Fischer",
+                "email": "simon@example.com"
+            },
+            "financial_status": "paid",
+            "fulfillment_status": None,
+            "shipping_lines": [
+                {
+                    "title": "DPD Food Express"
+                }
+            ],
+            "tags": "30-04-2025, qikify-boosterkit-first-sell",
+            "shipping_address": {
+                "address1": "Bleichstrasse 13",
+                "address2": None,
+                "city": "Wiesbaden",
+                "zip": "65183",
+                "country": "Germany"
+            },
+            "line_items": [
+                {
+                    "title": "Brisket",
+                    "variant_title": "1.900g",
+                    "quantity": 1,
+                    "price": "47.50"
+                },
+                {
+                    "title": "Gift Card",
+                    "variant_title": "",
+                    "quantity": 2,
+                    "price": "10.00"
+                }
+            ]
+        },
+        {
+            "id": 6683253899610,
+            "order_number": 1024,
+            "created_at": "2025-04-21T15:24:28+02:00",
+            "total_price": "31.59",
+            "currency": "EUR",
+            "customer": {
+                "first_name": "Ramona",
+                "last_name": "Hauser",
+                "email": "ramona@example.com"
+            },
+            "financial_status": "paid",
+            "fulfillment_status": "fulfilled",
+            "shipping_lines": [],
+            "tags": "",
+            "shipping_address": None,
+            "line_items": [
+                {
+                    "title": "Picanha",
+                    "variant_title": "350g",
+                    "quantity": 2,
+                    "price": "13.30"
+                }
+            ]
+        }
+    ]
+
+
+def make_response(orders, link=""):
+    """Build a mocked orders page response."""
+    response = MagicMock()
+    response.raise_for_status.return_value = None
+    response.content = json.dumps({"orders": orders}).encode()
+    response.raw = io.BytesIO(response.content)
+    response.headers = {"Link": link} if link else {}
+    return response
+
+
+class FakeOrderResponse:
+    """Minimal aiohttp response for a single order request."""
+
+    def __init__(self, order_id, delay):
+        self.order_id = order_id
+        self.delay = delay
+
+    async def __aenter__(self):
+        # Finish out of request order to check results keep the input order
+        await asyncio.sleep(self.delay)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        if self.order_id == 2:
+            raise aiohttp.ClientError("order not found")
+
+    async def json(self):
+        return {"order": {"id": self.order_id}}
+
+
+class TestShopifyClient:
+    """Test suite for the ShopifyClient class."""
+
+    def test_format_orders_for_knowledge_base(self, sample_orders):
+        """Test formatting orders for the knowledge base."""
+        client = ShopifyClient()
+        content = client.format_orders_for_knowledge_base(sample_orders)
+
+        assert content.startswith("# Taurbull Orders")
+        assert "ORDER NUMBER: 1025" in content
+        assert "CUSTOMER: Simon Fischer" in content
+        assert "FULFILLMENT STATUS: unfulfilled" in content
+        assert "DELIVERY STATUS: Not shipped yet" in content
+        assert "DELIVERY METHOD: DPD Food Express" in content
+        assert "EXPECTED DELIVERY: 30-04-2025" in content
+        assert "- 1x Brisket - 1.900g (47.50 EUR)" in content
+        assert "- 2x Gift Card (10.00 EUR)" in content
+        assert "65183 Wiesbaden" in content
+
+        assert "ORDER NUMBER: 1024" in content
+        assert "DELIVERY STATUS: Shipped" in content
+        assert "DELIVERY METHOD: Standard Shipping" in content
+        assert "EXPECTED DELIVERY: Not scheduled" in content
+        assert content.index("ORDER NUMBER: 1025") < content.index("ORDER NUMBER: 1024")
+
+    def test_format_orders_for_knowledge_base_empty(self):
+        """Test formatting when there are no orders."""
+        client = ShopifyClient()
+
+        assert client.format_orders_for_knowledge_base([]) == "No orders available."
+        assert client.format_orders_for_knowledge_base(iter([])) == "No orders available."
+
+    def test_format_orders_stream(self, sample_orders):
+        """Test that orders are formatted lazily, one chunk per order."""
+        client = ShopifyClient()
+        consumed = []
+
+        def orders():
+            for order in sample_orders:
+                consumed.append(order["order_number"])
+                yield order
+
+        chunks = client.format_orders_stream(orders())
+        assert next(chunks) == "# Taurbull Orders\n\n"
+        assert "ORDER NUMBER: 1025" in next(chunks)
+        assert consumed == [1025]
+
+        rest = list(chunks)
+        assert len(rest) == 1 and "ORDER NUMBER: 1024" in rest[0]
+        assert list(client.format_orders_stream([])) == ["No orders available."]
+
+    def test_format_orders_reuses_unchanged_result(self, sample_orders):
+        """Test that formatting is skipped when no order was updated."""
+        for order in sample_orders:
+            order["updated_at"] = "2025-04-22T10:00:00+02:00"
+        client = ShopifyClient()
+        first = client.format_orders_for_knowledge_base(sample_orders)
+
+        # Same ids and updated_at: the cached content is returned as is
+        sample_orders[0]["total_price"] = "99.99"
+        assert client.format_orders_for_knowledge_base(sample_orders) is first
+
+        # A newer updated_at invalidates the cached content
+        sample_orders[0]["updated_at"] = "2025-04-23T10:00:00+02:00"
+        assert "TOTAL: 99.99 EUR" in client.format_orders_for_knowledge_base(sample_orders)
+
+    def test_iter_orders_follows_next_link(self, sample_orders):
+        """Test that orders are read across pages using the Link header."""
+        next_url = "https://shop.example.com/admin/api/2024-01/orders.json?limit=1&page_info=abc"
+        client = ShopifyClient()
+
+        # Extra payload the formatter never reads
+        first_order = dict(sample_orders[0], admin_graphql_api_id="gid://shopify/Order/6683975942490")
+        first_order["line_items"] = [dict(item, tax_lines=[]) for item in first_order["line_items"]]
+
+        with patch.object(client._session, 'get') as mock_get:
+            mock_get.side_effect = [
+                make_response([first_order], link=f'<{next_url}>; rel="next"'),
+                make_response(sample_orders[1:]),
+            ]
+            orders = list(client.iter_orders(page_size=1))
+
+        assert [order["order_number"] for order in orders] == [1025, 1024]
+        assert "admin_graphql_api_id" not in orders[0]
+        assert orders[0]["line_items"] == sample_orders[0]["line_items"]
+        assert orders[1]["shipping_address"] is None
+        assert mock_get.call_count == 2
+        assert mock_get.call_args_list[1].args[0] == next_url
+
+    def test_iter_orders_connection_error(self, sample_orders):
+        """Test that only an unreachable first page is reported as no orders."""
+        next_url = "https://shop.example.com/admin/api/2024-01/orders.json?limit=1&page_info=abc"
+        client = ShopifyClient()
+
+        with patch.object(client._session, 'get', side_effect=requests.ConnectionError("down")):
+            assert client.get_orders(limit=10) == []
+
+        with patch.object(client._session, 'get') as mock_get:
+            mock_get.side_effect = [
+                make_response(sample_orders[:1], link=f'<{next_url}>; rel="next"'),
+                requests.ConnectionError("reset"),
+            ]
+            with pytest.raises(requests.ConnectionError):
+                client.get_orders(limit=500)
+
+    def test_iter_orders_closes_prefetched_page(self, sample_orders):
+        """Test that a prefetched page is released when iteration stops early."""
+        next_url = "https://shop.example.com/admin/api/2024-01/orders.json?limit=1&page_info=abc"
+        client = ShopifyClient()
+        second_page = make_response(sample_orders[1:])
+        responses = iter([make_response(sample_orders[:1], link=f'<{next_url}>; rel="next"'), second_page])
+        fetched = threading.Event()
+
+        def fake_get(*args, **kwargs):
+            response = next(responses)
+            if response is second_page:
+                fetched.set()
+            return response
+
+        with patch.object(client._session, 'get', side_effect=fake_get) as mock_get:
+            orders = client.iter_orders(page_size=1)
+            assert next(orders)["order_number"] == 1025
+            # Stop only once the next page is in flight
+            assert fetched.wait(timeout=5)
+            orders.close()
+
+        assert mock_get.call_count == 2
+        second_page.close.assert_called_once()
+
+    def test_iter_orders_with_cache(self, sample_orders, tmp_path):
+        """Test that cached clients read orders from the buffered response body."""
+        with patch(f"{ShopifyClient.__module__}.SHOPIFY_CACHE_PATH", tmp_path / "shopify_cache"):
+            client = ShopifyClient(use_cache=True)
+
+        with patch.object(client._session, 'get', return_value=make_response(sample_orders)) as mock_get:
+            orders = list(client.iter_orders())
+        client.close()
+
+        assert [order["order_number"] for order in orders] == [1025, 1024]
+        assert "X-Shopify-Access-Token" in client._session.settings.ignored_parameters
+        created_at_min = mock_get.call_args.kwargs["params"]["created_at_min"]
+        assert created_at_min.endswith(":00:00+00:00")
+
+    def test_get_order_details_many(self):
+        """Test that order details keep the input order and failures become None."""
+        client = ShopifyClient()
+        order_ids = [1, 2, 3]
+        requested = []
+
+        def fake_get(session, url):
+            order_id = int(url.rsplit("/", 1)[-1].split(".")[0])
+            requested.append(order_id)
+            return FakeOrderResponse(order_id, delay=0.01 * (len(order_ids) - order_id))
+
+        with patch.object(aiohttp.ClientSession, 'get', new=fake_get):
+            details = client.get_order_details_many_sync(order_ids)
+
+        assert details == [{"id": 1}, None, {"id": 3}]
+        assert sorted(requested) == order_ids
+
+    def test_get_orders_bulk(self, sample_orders):
+        """Test that bulk export lines are reassembled into REST-shaped orders."""
+        client = ShopifyClient()
+        order_gid = "gid://shopify/Order/6683975942490"
+        lines = [
+            {
+                "id": order_gid,
+                "legacyResourceId": "6683975942490",
+                "name": "#1025",
+                "createdAt": "2025-04-22T00:18:09+02:00",
+                "updatedAt": "2025-04-22T10:00:00+02:00",
+                "tags": ["30-04-2025", "qikify-boosterkit-first-sell"],
+                "displayFinancialStatus": "PAID",
+                "displayFulfillmentStatus": "UNFULFILLED",
+                "totalPriceSet": {"shopMoney": {"amount": "80.77", "currencyCode": "EUR"}},
+                "customer": {"firstName": "Simon", "lastName": "Fischer", "email": "simon@example.com"},
+                "shippingAddress": sample_orders[0]["shipping_address"],
+                "shippingLine": {"title": "DPD Food Express"},
+            },
+            {"title": "Brisket", "variantTitle": "1.900g", "quantity": 1,
+             "originalUnitPriceSet": {"shopMoney": {"amount": "47.50"}}, "__parentId": order_gid},
+            {"title": "Gift Card", "variantTitle": None, "quantity": 2,
+             "originalUnitPriceSet": {"shopMoney": {"amount": "10.00"}}, "__parentId": order_gid},
+        ]
+
+        started = MagicMock()
+        started.json.return_value = {"data": {"bulkOperationRunQuery": {
+            "bulkOperation": {"id": "gid://shopify/BulkOperation/1", "status": "CREATED"}, "userErrors": []}}}
+        running = MagicMock()
+        running.json.return_value = {"data": {"currentBulkOperation": {"status": "RUNNING"}}}
+        completed = MagicMock()
+        completed.json.return_value = {"data": {"currentBulkOperation": {
+            "status": "COMPLETED", "url": "https://storage.example.com/bulk.jsonl"}}}
+        export = MagicMock()
+        export.iter_lines.return_value = [json.dumps(line).encode() for line in lines]
+        export.__enter__.return_value = export
+
+        with patch.object(client._session, 'post', side_effect=[started, running, completed]), \
+                patch('requests.get', return_value=export) as mock_get, \
+                patch('time.sleep') as mock_sleep:
+            orders = list(client.get_orders_bulk(since_days=7))
+
+        assert mock_sleep.call_count == 1
+        assert mock_get.call_args.args[0] == "https://storage.example.com/bulk.jsonl"
+        assert len(orders) == 1
+        assert orders[0]["line_items"] == sample_orders[0]["line_items"]
+        assert orders[0]["order_number"] == 1025
+        assert orders[0]["fulfillment_status"] is None
+
+        expected = client.format_orders_for_knowledge_base(sample_orders[:1])
+        assert client.format_orders_for_knowledge_base(orders) == expected